@@ -0,0 +1,56 @@
+"""이미지 임포트 단계: 매니페스트의 각 이미지를 최종 크기로 디코드해 알파 채널을 검사하고,
+블릿 비용이 가장 싼 픽셀 포맷(opaque / colorkey / alpha)을 data/asset_formats.json에 기록합니다.
+
+에셋을 추가하거나 바꾼 뒤 한 번 실행합니다. 기록이 없거나 원본 파일 내용(크기, SHA-1)이 달라진 이미지는
+게임이 로드할 때 같은 방식으로 직접 판별하므로, 기록은 로드 시 검사를 생략하기 위한 것입니다.
+
+예시:
+    python asset_import.py
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import sys
+import json
+import argparse
+
+import pygame
+from config import ASSET_MANIFEST, ASSET_FORMATS_FILE
+from core import ResourceManager, classify_alpha
+
+def import_assets(rm, manifest):
+    entries = []
+    for name, size in manifest:
+        path = rm.find_path(name)
+        if path is None:
+            print(f"{name}: 파일 없음 (건너뜀)")
+            continue
+        img, scaled = rm.decode_image(path, size)
+        if size and not scaled: img = pygame.transform.smoothscale(img.convert_alpha(), size)
+        fmt, colorkey = classify_alpha(img)
+        entries.append({"file": os.path.basename(name), "size": list(size) if size else None,
+                        "format": fmt, "colorkey": list(colorkey) if colorkey else None,
+                        "source_bytes": os.path.getsize(path), "source_sha1": rm.source_digest(path)})
+        print(f"{name} {size}: {fmt}" + (f" {colorkey}" if colorkey else ""))
+    return entries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="이미지별 픽셀 포맷 판별 및 기록")
+    parser.add_argument("--out", default=ASSET_FORMATS_FILE, help="기록 파일 (기본: data/asset_formats.json)")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha()에 필요
+    entries = import_assets(ResourceManager(), ASSET_MANIFEST)
+    with open(args.out, "w", encoding="utf-8") as f:
+        # 이미지 하나당 한 줄로 기록 (에셋을 바꿨을 때 diff가 읽기 쉽도록)
+        f.write('{\n  "images": [\n')
+        f.write(",\n".join("    " + json.dumps(e, ensure_ascii=False) for e in entries))
+        f.write("\n  ]\n}\n")
+    print(f"{len(entries)}개 기록: {args.out}")
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
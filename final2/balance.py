@@ -0,0 +1,228 @@
+"""난이도 밸런스 몬테카를로 시뮬레이터.
+
+창 없이 봇이 조작하는 GameController를 여러 프로세스에서 돌려
+난이도 값 / 캐릭터 프리셋 조합별 생존 시간, 처치 수, 도달 레벨, 최대 적 수를 집계합니다.
+
+봇은 가까운 적에게서 멀어지면서, 위협이 적을 때는 가장 가까운 경험치 구슬 쪽으로 이동해
+직접 줍습니다 (실제 게임과 같이 구슬 획득 범위에 들어와야 경험치를 얻음). 따라서 도달 레벨과
+생존 시간은 "도망치며 구슬을 줍는 플레이어" 기준이며, 구슬 가치를 바로 지급하지는 않습니다.
+
+예시:
+    python balance.py --difficulty normal hard --preset tank speed \\
+        --set spawn_prob_end=0.3,0.5 --runs 20 --out runs.csv --summary summary.csv
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import sys
+import csv
+import math
+import random
+import argparse
+import itertools
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pygame
+from config import FPS, WIDTH, HEIGHT, MAX_SKILL_LEVEL, DIFFICULTY_SETTINGS, PLAYER_PRESETS
+from game_controller import GameController
+from skill import BaseShotSkill, FireConeSkill, ElectricShockSkill, ShieldSkill
+from screens import HealSkill
+
+RUN_FIELDS = ["difficulty", "preset", "overrides", "seed", "success", "reason",
+              "survival_time", "kills", "level", "peak_enemies"]
+# 구슬 쪽으로 끌리는 힘 (주변에 적이 없을 때 기준, 도망 힘이 클수록 줄어듦)
+ORB_SEEK_WEIGHT = 1.5
+
+SUMMARY_FIELDS = ["difficulty", "preset", "overrides", "runs", "win_rate",
+                  "survival_mean", "survival_median", "kills_mean", "level_mean", "peak_enemies_mean"]
+
+class NullAudio:
+    """헤드리스 실행용: 모든 오디오 호출을 무시합니다."""
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+class BotKeys:
+    """pygame.key.get_pressed() 대신 Player.move에 전달하는 가상 키 상태."""
+    def __init__(self):
+        self.down = set()
+
+    def __getitem__(self, key):
+        return key in self.down
+
+class HeadlessSession:
+    """GameScreen 대신 GameController에 전달되는 최소 게임 상태 (그리기/입력 없음)."""
+    def __init__(self, player_config):
+        self.audio = NullAudio()
+        self.img_spider = self.img_skull = self.img_midboss = self.img_finalboss = None
+        self.controller = GameController(None, player_config)
+
+        # GameScreen과 동일한 스킬 구성: 기본 공격만 1레벨, 나머지는 0레벨
+        self.skills = [BaseShotSkill(), FireConeSkill(), ElectricShockSkill(), ShieldSkill(), HealSkill()]
+        for i in range(1, len(self.skills)):
+            self.skills[i].level = 0
+        for s in self.skills:
+            s.player = self.controller.player
+            if hasattr(s, "bind"): s.bind(self.controller.scheduler)
+
+        self.keys = BotKeys()
+        self.result = None
+
+    def trigger_level_up(self):
+        # 선택지 3개 중 하나를 고르는 것과 같도록 업그레이드 가능한 스킬 중 무작위 선택
+        options = [s for s in self.skills if s.level < MAX_SKILL_LEVEL]
+        if options: random.choice(options).apply_upgrade()
+
+    def finish_game(self, success, reason):
+        if self.result is None: self.result = (success, reason)
+
+    def steer(self):
+        """가까운 적에게서 멀어지고 여유가 있으면 구슬을 주우러 가며, 가장 가까운 적을 조준합니다."""
+        c = self.controller
+        p = c.player.pos
+        push = pygame.Vector2(0, 0)
+        nearest, nearest_d = None, math.inf
+        for e in c.enemies:
+            d = p.distance_to(e.pos)
+            if d < nearest_d: nearest, nearest_d = e, d
+            if 0 < d < 260:
+                weight = 4.0 if e.kind in ("midboss", "finalboss") else 1.0
+                push += (p - e.pos) / d * weight * (260 - d) / 260
+        # 가장 가까운 구슬 쪽으로 이동: 도망쳐야 할 힘이 클수록 약하게 (위험할 때는 회피 우선)
+        orbs = c.orbs
+        if orbs.count:
+            delta = orbs.pos[:orbs.count] - (p.x, p.y)
+            k = int(np.argmin(np.einsum("ij,ij->i", delta, delta)))
+            to_orb = pygame.Vector2(float(delta[k, 0]), float(delta[k, 1]))
+            if to_orb.length_squared() > 1:
+                push += to_orb.normalize() * ORB_SEEK_WEIGHT / (1.0 + push.length())
+        # 아레나 중앙 쪽으로 약하게 당겨 모서리에 갇히지 않게 함
+        push += (pygame.Vector2(WIDTH * 0.5, HEIGHT * 0.55) - p) * 0.002
+
+        self.keys.down.clear()
+        if push.length_squared() > 0.01:
+            push = push.normalize()
+            if push.x > 0.3: self.keys.down.add(pygame.K_d)
+            if push.x < -0.3: self.keys.down.add(pygame.K_a)
+            if push.y > 0.3: self.keys.down.add(pygame.K_s)
+            if push.y < -0.3: self.keys.down.add(pygame.K_w)
+        # 적이 없을 때도 마우스를 읽지 않도록 항상 조준점을 지정
+        c.player.aim_pos = nearest.pos if nearest else p + pygame.Vector2(1, 0)
+
+def run_one(job):
+    """시드 고정 1회 시뮬레이션 (워커 프로세스에서 실행)."""
+    random.seed(job["seed"])
+    preset = next(p for p in PLAYER_PRESETS if p["id"] == job["preset"])
+    cfg = dict(preset)
+    cfg["DIFFICULTY"] = job["difficulty"]
+    cfg["DIFFICULTY_OVERRIDES"] = job["overrides"]
+
+    gs = HeadlessSession(cfg)
+    c = gs.controller
+    dt = 1.0 / FPS
+    peak = 0
+    while gs.result is None:
+        gs.steer()
+        c.tick_logic(dt, gs, gs.keys)
+        peak = max(peak, len(c.enemies))
+        # GameScreen.update와 같은 종료 조건
+        if c.player.hp <= 0: gs.finish_game(False, "플레이어 HP 소진")
+        if c.wave_mgr.elapsed >= c.wave_mgr.total_time: gs.finish_game(False, "시간 종료")
+
+    success, reason = gs.result
+    return {
+        "difficulty": job["difficulty"], "preset": job["preset"],
+        "overrides": format_overrides(job["overrides"]), "seed": job["seed"],
+        "success": int(success), "reason": reason,
+        "survival_time": round(c.wave_mgr.elapsed, 2), "kills": c.player.kills,
+        "level": c.player.level, "peak_enemies": peak,
+    }
+
+def format_overrides(overrides):
+    return ";".join(f"{k}={v}" for k, v in sorted(overrides.items()))
+
+def parse_value(text):
+    for cast in (int, float):
+        try: return cast(text)
+        except ValueError: pass
+    return text
+
+def parse_grid(items):
+    """["key=v1,v2", ...] -> 덮어쓰기 dict 조합 목록 (데카르트 곱)."""
+    axes = []
+    for item in items or []:
+        key, _, values = item.partition("=")
+        if key not in DIFFICULTY_SETTINGS["normal"]:
+            raise SystemExit(f"알 수 없는 난이도 항목: {key}")
+        axes.append([(key, parse_value(v)) for v in values.split(",") if v])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+def build_jobs(args):
+    jobs = []
+    for diff, preset, overrides in itertools.product(args.difficulty, args.preset, parse_grid(args.set)):
+        for i in range(args.runs):
+            jobs.append({"difficulty": diff, "preset": preset, "overrides": overrides, "seed": args.seed + i})
+    return jobs
+
+def summarize(rows):
+    groups = {}
+    for r in rows:
+        groups.setdefault((r["difficulty"], r["preset"], r["overrides"]), []).append(r)
+    out = []
+    for (diff, preset, overrides), rs in sorted(groups.items()):
+        surv = [r["survival_time"] for r in rs]
+        out.append({
+            "difficulty": diff, "preset": preset, "overrides": overrides, "runs": len(rs),
+            "win_rate": round(sum(r["success"] for r in rs) / len(rs), 3),
+            "survival_mean": round(statistics.fmean(surv), 2),
+            "survival_median": round(statistics.median(surv), 2),
+            "kills_mean": round(statistics.fmean(r["kills"] for r in rs), 1),
+            "level_mean": round(statistics.fmean(r["level"] for r in rs), 2),
+            "peak_enemies_mean": round(statistics.fmean(r["peak_enemies"] for r in rs), 1),
+        })
+    return out
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="난이도 밸런스 몬테카를로 시뮬레이터")
+    parser.add_argument("--difficulty", nargs="+", default=["normal"], choices=sorted(DIFFICULTY_SETTINGS))
+    parser.add_argument("--preset", nargs="+", default=[p["id"] for p in PLAYER_PRESETS],
+                        choices=[p["id"] for p in PLAYER_PRESETS])
+    parser.add_argument("--set", action="append", metavar="KEY=V1,V2",
+                        help="DIFFICULTY_SETTINGS 값 격자 (여러 번 지정 가능)")
+    parser.add_argument("--runs", type=int, default=10, help="조합당 시드 수")
+    parser.add_argument("--seed", type=int, default=0, help="시작 시드")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="워커 프로세스 수 (기본: 전체 코어)")
+    parser.add_argument("--out", default="balance_runs.csv", help="실행별 결과 CSV (완료되는 대로 기록)")
+    parser.add_argument("--summary", default="balance_summary.csv", help="조합별 집계 CSV")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = build_jobs(args)
+    rows = []
+    print(f"{len(jobs)}회 시뮬레이션, 워커 {args.workers}개")
+
+    with open(args.out, "w", newline="", encoding="utf-8") as f, \
+         ProcessPoolExecutor(max_workers=args.workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=RUN_FIELDS)
+        writer.writeheader()
+        for fut in as_completed([pool.submit(run_one, job) for job in jobs]):
+            row = fut.result()
+            rows.append(row)
+            writer.writerow(row); f.flush()
+            print(f"[{len(rows)}/{len(jobs)}] {row['difficulty']}/{row['preset']} {row['overrides']} "
+                  f"seed={row['seed']} -> {row['reason']} {row['survival_time']}s Lv{row['level']}")
+
+    summary = summarize(rows)
+    with open(args.summary, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(summary)
+    for s in summary:
+        print(f"{s['difficulty']:>6} {s['preset']:>6} {s['overrides'] or '-':<24} "
+              f"승률 {s['win_rate']:.0%}  생존 {s['survival_mean']}s  Lv {s['level_mean']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
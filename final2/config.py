@@ -6,10 +6,15 @@ import pygame
 # -----------------------------
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
+STARTUP_BUDGET_MS = 1500  # 실행부터 첫 프레임까지 허용 시간 (--check-startup으로 검사)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 ASSET_DIR = os.path.join(BASE_DIR, "assets")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")  # 스케일된 이미지의 디스크 캐시 (원시 RGBA)
+IMAGE_DISK_CACHE = True
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024  # 메모리에 상주시킬 이미지 총 바이트 (초과 시 미사용 이미지부터 제거)
+LOG_DIR = os.path.join(BASE_DIR, "logs")     # 세션별 프레임 시간 기록
 
 # 색상 정의
 WHITE = (245, 245, 245)
@@ -20,6 +25,79 @@ RED = (235, 80, 80)
 YELLOW = (255, 220, 80)
 
 MAX_SKILL_LEVEL = 5
+# 스킬 레벨별 스탯 덮어쓰기 파일 (선택). 예: {"BaseShotSkill": {"3": {"interval": 0.7}}}
+SKILL_STATS_FILE = os.path.join(DATA_DIR, "skill_stats.json")
+
+# ✅ 웨이브 타임라인 파일 (보스 등장 시각, 스폰 비율 곡선)
+WAVES_FILE = os.path.join(DATA_DIR, "waves.json")
+# 개발 모드(TANGTANG_DEV=1)에서는 게임 중 waves.json 수정 사항을 다시 불러옴
+DEV_MODE = os.environ.get("TANGTANG_DEV", "") not in ("", "0")
+WAVES_RELOAD_INTERVAL = 1.0  # 파일 변경 확인 주기 (초)
+
+# ✅ 시작 시 미리 불러올 이미지 목록 (파일명, 크기)
+# ResourceManager.get_image 호출과 같은 (파일명, 크기) 조합이어야 캐시가 적중합니다.
+ASSET_MANIFEST = (
+    ("game_background.png", (WIDTH, HEIGHT)),
+    ("player_1.png", (150, 150)), ("player_2.png", (150, 150)), ("player_3.png", (150, 150)),  # 선택 카드
+    ("player_1.png", (80, 80)), ("player_2.png", (80, 80)), ("player_3.png", (80, 80)),        # 인게임
+    ("monster_spider.png", (30, 30)),
+    ("monster_bone.png", (30, 30)),
+    ("middle_boss_dimenter.png", (120, 120)),
+    ("final_boss_pumpkin.png", (150, 150)),
+)
+
+# ✅ 이미지별 픽셀 포맷 기록 (asset_import.py가 생성)
+# opaque: convert(), colorkey: convert()+컬러키(RLEACCEL), alpha: convert_alpha()
+ASSET_FORMATS_FILE = os.path.join(DATA_DIR, "asset_formats.json")
+
+# ✅ 경험치 구슬 설정
+ORB_CAPACITY = 4096        # 동시에 존재할 수 있는 최대 구슬 수 (배열 크기)
+ORB_MERGE_CAP = 200        # 이 개수를 넘으면 가까운 구슬끼리 합쳐서 개수를 줄임
+ORB_MERGE_CELL = 48        # 합치기 판정에 쓰는 격자 칸 크기(px)
+ORB_MAGNET_RADIUS = 150    # 자석 범위: 이 안에 들어온 구슬은 플레이어에게 끌려옴
+ORB_PICKUP_RADIUS = 28     # 획득 범위
+ORB_SPEED = 520            # 끌려오는 속도 (px/s)
+
+# ✅ 데미지 숫자 설정
+DMG_TEXT_CAPACITY = 96     # 링 버퍼 크기: 넘치면 가장 오래된 숫자를 재사용
+DMG_TEXT_COALESCE = 0.25   # 같은 적이 이 시간(초) 안에 다시 맞으면 숫자를 합산
+DMG_TEXT_LIFE = 0.7        # 숫자가 떠 있는 시간(초)
+DMG_TEXT_RISE = 28         # 사라질 때까지 떠오르는 높이(px)
+# ✅ 파티클 설정
+PARTICLE_CAPACITY = 20000  # 동시에 살아있을 수 있는 최대 파티클 수 (배열 크기)
+PARTICLE_DRAG = 3.0        # 초당 속도 감쇠 계수 (클수록 빨리 멈춤)
+PARTICLE_FIRE = 28         # 화염 폭발 1회당 파티클 수
+PARTICLE_DEATH = 10        # 일반 몬스터 처치 시 파티클 수
+PARTICLE_BOSS_DEATH = 160  # 보스 처치 시 파티클 수
+
+# ✅ 시뮬레이션 스레드 설정 (main.py --sim-thread로 켬)
+# 켜면 게임 로직이 별도 스레드에서 SIM_RATE 고정 주기로 돌고, 화면은 최신 스냅샷을 그림
+SIM_THREAD = False
+SIM_RATE = 60
+
+# ✅ 렌더 배율 설정 (main.py --render-scale로 변경)
+# 1보다 작으면 게임 월드를 WIDTH*RENDER_SCALE x HEIGHT*RENDER_SCALE 내부 표면에 그린 뒤
+# 화면 크기로 늘려 출력 (HUD/오버레이/데미지 숫자는 원래 해상도로 그림)
+# 0.75처럼 정수배가 아닌 배율은 CPU 확대 비용이 줄어든 채우기 비용보다 커서(1.0보다 느림) 1.0 또는 0.5만 사용
+RENDER_SCALE = 1.0
+
+# ✅ 프레임 대기 방식 (main.py --pacing으로 변경): tick / busy / vsync / hybrid
+FRAME_PACING = "tick"
+PACING_SPIN_MS = 2.0        # hybrid: 목표 시각 몇 ms 전부터 sleep 대신 busy-wait 할지
+FRAME_LOG = True            # 종료 시 프레임 시간 히스토그램을 LOG_DIR에 저장
+FRAME_MISS_RATIO = 1.5      # 프레임 간격이 예산(1000/FPS ms)의 1.5배를 넘으면 놓친 프레임으로 집계
+
+# ✅ GC 설정 (게임 화면에서는 자동 수집 임계값을 높이고, 오버레이/화면 전환 때 전체 수집)
+# 기본값 (700, 10, 10) 대비 0세대 수집을 줄이고 2세대 자동 수집은 사실상 일어나지 않게 함
+GC_GAMEPLAY_THRESHOLD = (5000, 20, 1000)
+
+# ✅ 적응형 그래픽 품질 설정 (프레임 시간에 따라 연출을 단계적으로 줄임)
+QUALITY_ADAPTIVE = True
+QUALITY_WINDOW = 60          # 평균 프레임 작업 시간을 계산할 최근 프레임 수
+QUALITY_DOWN_RATIO = 0.9     # 평균 작업 시간이 프레임 예산(1000/FPS ms)의 90%를 넘으면 한 단계 낮춤
+QUALITY_UP_RATIO = 0.6       # 60% 미만이면 한 단계 높임 (두 기준 사이에서는 유지)
+QUALITY_HOLD = 2.0           # 단계를 바꾼 뒤 다시 판단하기까지 대기 시간(초)
+
 # ✅ 오디오 자원 설정
 BGM_START = "start_bgm.mp3"
 BGM_GAME = "game_bgm.mp3"
@@ -27,9 +105,31 @@ BGM_FINAL_BOSS = "final_boss_bgm.mp3"  # 최종 보스전 브금
 BGM_CLEAR = "clear_bgm.mp3"           # 게임 클리어 브금
 SFX_MIDBOSS_SPAWN = "midboss_sfx.mp3" # 중간 보스 등장 효과음
 
+# ✅ BGM 전환 설정
+BGM_FADE_MS = 1200                               # 곡 전환 시 이전 곡 페이드아웃 / 새 곡 페이드인 시간(ms)
+BGM_PRELOAD = (BGM_START, BGM_GAME)              # 시작 시 미리 읽어 둘 BGM (압축 파일 그대로 보관)
+BGM_PREPARE_LEAD = 10.0                          # 최종 보스 등장 몇 초 전에 보스 BGM을 준비할지
+
+# ✅ 효과음 채널 풀 설정
+SFX_CHANNELS = 16                                # 효과음 전용 믹서 채널 수
+SFX_PRELOAD = (SFX_MIDBOSS_SPAWN,)               # 시작 시 미리 디코드할 효과음
+# priority: 채널이 부족할 때 높은 쪽이 낮은 쪽 채널을 빼앗음
+# max_voices: 같은 효과음의 동시 재생 수 (초과 시 가장 오래된 재생을 끊음)
+SFX_DEFAULT = {"priority": 1, "max_voices": 4}
+SFX_SETTINGS = {
+    SFX_MIDBOSS_SPAWN: {"priority": 10, "max_voices": 1},
+}
+
+# ✅ 캐릭터 프리셋 (시작 화면 카드와 밸런스 시뮬레이터가 함께 사용)
+PLAYER_PRESETS = [
+    {"id": "tank", "name": "플레이어 1", "HP": 150, "VEL": 240, "DMG": 1.0, "img_file": "player_1.png"},
+    {"id": "speed", "name": "플레이어 2", "HP": 100, "VEL": 360, "DMG": 1.0, "img_file": "player_2.png"},
+    {"id": "damage", "name": "플레이어 3", "HP": 100, "VEL": 240, "DMG": 1.5, "img_file": "player_3.png"}
+]
+
 # ✅ 난이도별 설정값
 # spawn_prob_start: 시작 시점(0분)의 스폰 확률
-# spawn_prob_end: 종료 시점(5분)의 스폰 확률 (계단식으로 증가)
+# spawn_prob_end: 종료 시점(5분)의 스폰 확률 (waves.json의 spawn_curve 비율로 보간)
 # boss_count: 보스 소환 마리 수
 # mob_hp: 일반 몬스터 기본 체력
 # boss_hp: 보스 몬스터 기본 체력
@@ -1,6 +1,15 @@
+import io
 import os
+import json
+import hashlib
+import queue
+import threading
+from collections import OrderedDict, deque, namedtuple
 import pygame
-from config import ASSET_DIR, DATA_DIR, WHITE
+from gc_policy import GcPolicy
+from config import (ASSET_DIR, DATA_DIR, CACHE_DIR, IMAGE_DISK_CACHE, IMAGE_CACHE_BUDGET, ASSET_FORMATS_FILE,
+                    WHITE, WIDTH, HEIGHT, FPS, SFX_CHANNELS, SFX_DEFAULT, SFX_SETTINGS, BGM_FADE_MS,
+                    SIM_THREAD, RENDER_SCALE, QUALITY_ADAPTIVE, QUALITY_WINDOW, QUALITY_DOWN_RATIO, QUALITY_UP_RATIO, QUALITY_HOLD)
 
 # -----------------------------
 # 1. Audio Manager (BGM & SFX)
@@ -11,22 +20,79 @@ class AudioManager:
         self.current_track = None
         self.paused = False
         self.sfx_cache = {}
+        self.sfx_loading = set()
+        # 효과음 채널 풀 (믹서 초기화 이후 처음 재생할 때 생성)
+        self.channels = None
+        self.voices = []        # 채널별 (파일명, 우선순위, 시작 순번) 또는 None
+        self._voice_serial = 0
+        # BGM은 pygame.mixer.music으로 스트리밍하고, 미리 준비한 곡은 압축된 파일 내용만 메모리에 보관
+        self.bgm_data = {}
+        self.bgm_loading = set()
+        self.bgm_stream = None   # 재생 중인 곡의 메모리 파일 (믹서가 읽는 동안 참조 유지)
+        self.playing_bgm = None  # 실제로 재생을 시작한 곡
+        self.pending_bgm = None  # 이전 곡 페이드아웃이 끝나면 재생할 (파일명, loop, fade_ms)
 
     # --- BGM 로직 ---
-    def play_bgm(self, filename, loop=-1):
-        """배경 음악을 재생합니다. 동일 곡이면 무시합니다."""
-        if self.current_track == filename:
-            return
-        
-        path = os.path.join(ASSET_DIR, filename)
-        if os.path.exists(path):
-            try:
+    def _load_bgm(self, filename):
+        try:
+            with open(os.path.join(ASSET_DIR, filename), "rb") as f: self.bgm_data[filename] = f.read()
+        except OSError as e:
+            print(f"BGM 로드 오류 ({filename}): {e}")
+        self.bgm_loading.discard(filename)
+
+    def prepare_bgm(self, filename):
+        """BGM 파일을 워커 스레드에서 미리 읽어 둡니다 (게임 틱에서 디스크 I/O가 없도록).
+
+        디코드는 재생하면서 스트리밍으로 하므로 곡당 압축된 파일 크기만큼만 메모리를 씁니다.
+        """
+        if not pygame.mixer.get_init(): return
+        if filename in self.bgm_data or filename in self.bgm_loading: return
+        if not os.path.exists(os.path.join(ASSET_DIR, filename)): return
+        self.bgm_loading.add(filename)
+        threading.Thread(target=self._load_bgm, args=(filename,), name="bgm-preloader", daemon=True).start()
+
+    def _start_bgm(self, filename, loop, fade_ms):
+        data = self.bgm_data.get(filename)
+        try:
+            if data is not None:
+                self.bgm_stream = io.BytesIO(data)
+                pygame.mixer.music.load(self.bgm_stream, os.path.splitext(filename)[1][1:])
+            else:
+                path = os.path.join(ASSET_DIR, filename)
+                if not os.path.exists(path): return
+                self.bgm_stream = None
                 pygame.mixer.music.load(path)
-                pygame.mixer.music.play(loop)
-                self.current_track = filename
-                self.paused = False
-            except Exception as e:
-                print(f"BGM 재생 오류: {e}")
+            pygame.mixer.music.play(loop, fade_ms=fade_ms)
+        except Exception as e:
+            print(f"BGM 재생 오류: {e}")
+            return
+        # 캐시는 현재 곡과 아직 재생하지 않은(다음) 곡만 유지: 방금 끝난 곡은 버림
+        if self.playing_bgm not in (None, filename): self.bgm_data.pop(self.playing_bgm, None)
+        self.playing_bgm = filename
+
+    def play_bgm(self, filename, loop=-1, fade_ms=BGM_FADE_MS):
+        """배경 음악을 재생합니다. 동일 곡이면 무시합니다.
+
+        이전 곡이 재생 중이면 fade_ms 동안 페이드아웃한 뒤 update()에서 새 곡을 페이드인합니다.
+        """
+        if self.current_track == filename or not pygame.mixer.get_init():
+            return
+        if filename not in self.bgm_data and not os.path.exists(os.path.join(ASSET_DIR, filename)): return
+        self.current_track = filename
+        self.paused = False
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+            self.pending_bgm = (filename, loop, fade_ms)
+        else:
+            self.pending_bgm = None
+            self._start_bgm(filename, loop, fade_ms)
+
+    def update(self):
+        """매 프레임 호출: 이전 곡의 페이드아웃이 끝났으면 대기 중인 BGM을 재생합니다."""
+        if self.pending_bgm and not self.paused and not pygame.mixer.music.get_busy():
+            filename, loop, fade_ms = self.pending_bgm
+            self.pending_bgm = None
+            self._start_bgm(filename, loop, fade_ms)
 
     # ✅ 호환성 유지: 기존 screens.py에서 .play()를 호출하므로 별칭 추가
     def play(self, filename, loop=-1):
@@ -34,7 +100,7 @@ class AudioManager:
         self.play_bgm(filename, loop)
 
     def pause_bgm(self):
-        if not self.paused:
+        if not self.paused and pygame.mixer.get_init():
             pygame.mixer.music.pause()
             self.paused = True
 
@@ -43,7 +109,7 @@ class AudioManager:
         self.pause_bgm()
 
     def unpause_bgm(self):
-        if self.paused:
+        if self.paused and pygame.mixer.get_init():
             pygame.mixer.music.unpause()
             self.paused = False
 
@@ -51,64 +117,381 @@ class AudioManager:
     def unpause(self):
         self.unpause_bgm()
 
-    def stop_bgm(self):
-        pygame.mixer.music.stop()
+    def stop_bgm(self, fade_ms=0):
+        """BGM을 멈춥니다. fade_ms를 주면 블로킹 없이 페이드아웃합니다."""
+        if pygame.mixer.get_init():
+            if fade_ms > 0: pygame.mixer.music.fadeout(fade_ms)
+            else: pygame.mixer.music.stop()
+        self.pending_bgm = None
         self.current_track = None
         self.paused = False
 
     # ✅ 호환성 유지
-    def stop(self):
-        self.stop_bgm()
+    def stop(self, fade_ms=0):
+        self.stop_bgm(fade_ms)
 
     # --- SFX 로직 ---
-    def play_sfx(self, filename):
-        """단발성 효과음을 1회 재생합니다."""
-        if filename not in self.sfx_cache:
+    def _load_sfx(self, filenames):
+        for filename in filenames:
             path = os.path.join(ASSET_DIR, filename)
             if os.path.exists(path):
                 try:
                     self.sfx_cache[filename] = pygame.mixer.Sound(path)
-                except:
-                    return
-            else:
-                return
-        
-        self.sfx_cache[filename].play()
+                except Exception as e:
+                    print(f"효과음 로드 오류 ({filename}): {e}")
+            self.sfx_loading.discard(filename)
+
+    def preload_sfx(self, filenames, background=True):
+        """효과음을 미리 디코드합니다. background면 워커 스레드에서 진행합니다."""
+        if not pygame.mixer.get_init(): return
+        names = [f for f in filenames if f not in self.sfx_cache and f not in self.sfx_loading]
+        if not names: return
+        self.sfx_loading.update(names)
+        if background:
+            threading.Thread(target=self._load_sfx, args=(names,), name="sfx-preloader", daemon=True).start()
+        else:
+            self._load_sfx(names)
+
+    def _init_channels(self):
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), SFX_CHANNELS))
+        self.channels = [pygame.mixer.Channel(i) for i in range(SFX_CHANNELS)]
+        self.voices = [None] * SFX_CHANNELS
+
+    def _pick_channel(self, filename, priority, max_voices):
+        """재생할 채널 번호를 고릅니다. 빼앗을 수 있는 채널도 없으면 None."""
+        busy = [i for i, ch in enumerate(self.channels) if ch.get_busy() and self.voices[i]]
+        # 1) 같은 효과음이 동시 재생 한도에 도달했으면 가장 오래된 재생을 재사용
+        same = [i for i in busy if self.voices[i][0] == filename]
+        if len(same) >= max_voices:
+            return min(same, key=lambda i: self.voices[i][2])
+        # 2) 비어 있는 채널
+        for i, ch in enumerate(self.channels):
+            if not ch.get_busy(): return i
+        # 3) 우선순위가 같거나 낮은 재생 중 가장 낮고 오래된 것을 빼앗음
+        victims = [i for i in busy if self.voices[i][1] <= priority]
+        if not victims: return None
+        return min(victims, key=lambda i: (self.voices[i][1], self.voices[i][2]))
+
+    def play_sfx(self, filename):
+        """단발성 효과음을 1회 재생합니다. 아직 디코드되지 않았다면 로드만 예약하고 건너뜁니다."""
+        if not pygame.mixer.get_init(): return
+        sound = self.sfx_cache.get(filename)
+        if sound is None:
+            # 게임 틱에서 디코드하지 않도록 백그라운드 로드만 요청
+            self.preload_sfx([filename])
+            return
+        if self.channels is None: self._init_channels()
+
+        settings = SFX_SETTINGS.get(filename, SFX_DEFAULT)
+        idx = self._pick_channel(filename, settings["priority"], settings["max_voices"])
+        if idx is None: return
+        self._voice_serial += 1
+        self.voices[idx] = (filename, settings["priority"], self._voice_serial)
+        self.channels[idx].play(sound)
+
+    def stop_sfx(self, filename):
+        """해당 효과음을 재생 중인 채널을 모두 멈춥니다."""
+        if not self.channels: return
+        for i, voice in enumerate(self.voices):
+            if voice and voice[0] == filename:
+                self.channels[i].stop()
+                self.voices[i] = None
 
 # -----------------------------
 # 2. ResourceManager
 # -----------------------------
+class ImageHandle:
+    """캐시 이미지를 사용하는 동안 LRU 제거 대상에서 제외(pin)하는 핸들입니다."""
+    def __init__(self, rm, key, surface):
+        self.rm = rm
+        self.key = key
+        self.surface = surface
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.rm._unpin(self.key)
+
+# 컬러키 후보 (불투명 픽셀에 쓰이지 않은 첫 번째 색을 키로 사용)
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (0, 255, 255), (1, 2, 3))
+
+def classify_alpha(img):
+    """최종 크기의 이미지 알파 채널을 검사해 가장 싼 픽셀 포맷 (포맷, 컬러키)을 고릅니다.
+
+    opaque: 모든 픽셀이 불투명, colorkey: 완전 투명/불투명 픽셀만 있음, alpha: 반투명 픽셀이 있음
+    """
+    w, h = img.get_size()
+    solid = pygame.mask.from_surface(img, 254).count()
+    if solid == w * h: return "opaque", None
+    if solid == pygame.mask.from_surface(img, 0).count():
+        for key in COLORKEY_CANDIDATES:
+            if pygame.mask.from_threshold(img, (*key, 255), (1, 1, 1, 1)).count() == 0:
+                return "colorkey", key
+    return "alpha", None
+
+def apply_pixel_format(img, fmt, colorkey=None):
+    """기록된 포맷으로 디스플레이 포맷 변환을 합니다 (메인 스레드 전용)."""
+    if fmt == "opaque": return img.convert()
+    if fmt == "colorkey":
+        out = pygame.Surface(img.get_size()).convert()
+        out.fill(colorkey)
+        out.blit(img, (0, 0))
+        out.set_colorkey(colorkey, pygame.RLEACCEL)
+        return out
+    return img.convert_alpha()
+
+def load_asset_formats(path=ASSET_FORMATS_FILE):
+    """asset_formats.json -> {캐시 키: 기록}. 파일이 없거나 잘못되면 빈 dict (로드 시 직접 판별)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)["images"]
+        return {ResourceManager.cache_key(e["file"], tuple(e["size"]) if e["size"] else None): e for e in entries}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
 class ResourceManager:
-    def __init__(self):
+    def __init__(self, budget_bytes=IMAGE_CACHE_BUDGET):
         if not os.path.exists(DATA_DIR): os.makedirs(DATA_DIR)
         if not os.path.exists(ASSET_DIR): os.makedirs(ASSET_DIR)
-        self.images = {}
+        # 키 -> Surface (앞쪽일수록 오래 전에 사용됨)
+        self.images = OrderedDict()
+        self.image_bytes = {}
+        self.image_refs = {}
+        self.resident_bytes = 0
+        self.budget_bytes = budget_bytes
+        # 이미지별 픽셀 포맷 기록 (없는 이미지는 로드할 때 알파 채널을 검사해서 결정)
+        self.formats = load_asset_formats()
+        self.digests = {}  # (경로, 수정 시각, 크기) -> 원본 SHA-1 (포맷 기록 검증용)
 
-    def get_image(self, name, size, color=(70, 70, 80)):
+    # --- 메모리 예산 / LRU ---
+    def _store(self, key, surf):
+        if key in self.images: self.resident_bytes -= self.image_bytes[key]
+        size = surf.get_pitch() * surf.get_height()
+        self.images[key] = surf
+        self.images.move_to_end(key)
+        self.image_bytes[key] = size
+        self.resident_bytes += size
+        self._evict(keep=key)
+        return surf
+
+    def _evict(self, keep=None):
+        """예산을 넘으면 참조 중이지 않은 이미지를 오래된 순서로 제거합니다."""
+        if self.resident_bytes <= self.budget_bytes: return
+        for key in list(self.images):
+            if self.resident_bytes <= self.budget_bytes: break
+            if key == keep or self.image_refs.get(key, 0) > 0: continue
+            del self.images[key]
+            self.resident_bytes -= self.image_bytes.pop(key)
+
+    def _unpin(self, key):
+        refs = self.image_refs.get(key, 0) - 1
+        if refs > 0: self.image_refs[key] = refs
+        else:
+            self.image_refs.pop(key, None)
+            self._evict()
+
+    def acquire_image(self, name, size, color=(70, 70, 80)):
+        """이미지를 가져와 고정합니다. 사용이 끝나면 handle.release()를 호출해야 합니다."""
+        surf = self.get_image(name, size, color)
+        key = self.cache_key(name, size)
+        self.image_refs[key] = self.image_refs.get(key, 0) + 1
+        return ImageHandle(self, key, surf)
+
+    def memory_report(self):
+        """에셋별 상주 바이트와 참조 수를 큰 순서로 반환합니다."""
+        rows = [{"key": k, "bytes": self.image_bytes[k], "refs": self.image_refs.get(k, 0)} for k in self.images]
+        rows.sort(key=lambda r: r["bytes"], reverse=True)
+        return {"resident_bytes": self.resident_bytes, "budget_bytes": self.budget_bytes, "assets": rows}
+
+    @staticmethod
+    def cache_key(name, size):
+        return f"{os.path.basename(name)}_{size}"
+
+    def find_path(self, name):
         file_name = os.path.basename(name)
-        cache_key = f"{file_name}_{size}"
-        if cache_key in self.images: return self.images[cache_key]
-        search_paths = [os.path.join(ASSET_DIR, file_name), name]
-        for path in search_paths:
-            if os.path.exists(path):
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                    if size: img = pygame.transform.smoothscale(img, size)
-                    self.images[cache_key] = img
-                    return img
-                except: pass
+        for path in (os.path.join(ASSET_DIR, file_name), name):
+            if path and os.path.exists(path): return path
+        return None
+
+    def _disk_cache_path(self, path, size):
+        """(원본 경로, 수정 시각, 크기)로 디스크 캐시 파일 경로를 만듭니다."""
+        st = os.stat(path)
+        key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{size[0]}x{size[1]}"
+        return os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".rgba")
+
+    def _load_disk_cache(self, cache_path, size):
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) != size[0] * size[1] * 4: return None
+        # PNG 디코드와 리샘플링 없이 원시 픽셀 버퍼를 그대로 Surface로 사용
+        return pygame.image.frombuffer(data, size, "RGBA")
+
+    def _save_disk_cache(self, cache_path, img):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(pygame.image.tobytes(img, "RGBA"))
+            os.replace(tmp, cache_path)
+        except OSError as e:
+            print(f"이미지 캐시 저장 오류: {e}")
+
+    def decode_image(self, path, size):
+        """디스플레이 포맷 변환 없이 디코드+스케일만 합니다 (워커 스레드에서 호출 가능).
+
+        스케일된 결과는 디스크 캐시에 저장해 두고, 다음 실행부터는 캐시를 읽습니다.
+        반환값: (Surface, 스케일 완료 여부)
+        """
+        cache_path = None
+        if size and IMAGE_DISK_CACHE:
+            cache_path = self._disk_cache_path(path, size)
+            cached = self._load_disk_cache(cache_path, size)
+            if cached is not None: return cached, True
+
+        img = pygame.image.load(path)
+        if not size: return img, True
+        try:
+            img = pygame.transform.smoothscale(img, size)
+        except ValueError:
+            # 팔레트 이미지 등 smoothscale이 불가능한 포맷은 변환 후 메인 스레드에서 스케일
+            return img, False
+        if cache_path: self._save_disk_cache(cache_path, img)
+        return img, True
+
+    def pixel_format(self, key, img, path=None):
+        """기록된 포맷이 원본 파일과 일치하면 그대로 쓰고, 아니면 알파 채널을 검사합니다."""
+        entry = self.formats.get(key)
+        # 크기로 먼저 걸러낸 뒤 내용 해시까지 같을 때만 기록을 믿음 (크기가 같은 수정본도 다시 판별)
+        if (entry and path and entry.get("source_bytes") == os.path.getsize(path)
+                and entry.get("source_sha1") == self.source_digest(path)):
+            return entry["format"], tuple(entry["colorkey"]) if entry.get("colorkey") else None
+        return classify_alpha(img)
+
+    def source_digest(self, path):
+        """원본 파일 내용의 SHA-1 (같은 실행 안에서는 경로/수정 시각/크기가 같으면 다시 읽지 않음)."""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        digest = self.digests.get(key)
+        if digest is None:
+            with open(path, "rb") as f: digest = hashlib.sha1(f.read()).hexdigest()
+            self.digests[key] = digest
+        return digest
+
+    def finish_image(self, key, img, size, scaled, path=None):
+        """디스플레이 포맷으로 변환해 캐시에 넣습니다 (메인 스레드 전용).
+
+        불투명 이미지는 convert(), 투명/불투명만 있는 이미지는 컬러키, 나머지만 convert_alpha()로
+        변환해서 블릿할 때 가장 싼 경로를 쓰게 합니다. 판별은 최종 크기 기준이라 결과 픽셀은 같습니다.
+        """
+        if size and not scaled: img = pygame.transform.smoothscale(img.convert_alpha(), size)
+        fmt, colorkey = self.pixel_format(key, img, path)
+        return self._store(key, apply_pixel_format(img, fmt, colorkey))
+
+    def get_image(self, name, size, color=(70, 70, 80)):
+        cache_key = self.cache_key(name, size)
+        if cache_key in self.images:
+            self.images.move_to_end(cache_key)
+            return self.images[cache_key]
+        path = self.find_path(name)
+        if path:
+            try:
+                img, scaled = self.decode_image(path, size)
+                return self.finish_image(cache_key, img, size, scaled, path)
+            except: pass
         surf = pygame.Surface(size if size else (64, 64), pygame.SRCALPHA)
         surf.fill((*color, 255))
         pygame.draw.rect(surf, (160, 160, 170), surf.get_rect(), 3)
-        self.images[cache_key] = surf
-        return surf
+        return self._store(cache_key, surf)
+
+class AssetPreloader:
+    """매니페스트의 이미지를 워커 스레드에서 디코드/스케일하고, 메인 스레드에서 변환해 캐시에 넣습니다.
+
+    pygame의 이미지 디코드와 스케일은 GIL을 풀기 때문에 로딩 화면을 그리는 동안
+    병렬로 진행됩니다. 디스플레이 포맷 변환(convert/convert_alpha)은 pump()에서 처리합니다.
+    """
+    def __init__(self, rm, manifest):
+        self.rm = rm
+        self.manifest = list(manifest)
+        self.total = len(self.manifest)
+        self.loaded = 0
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="asset-preloader", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _worker(self):
+        for name, size in self.manifest:
+            img, scaled = None, False
+            path = self.rm.find_path(name)
+            if path:
+                try:
+                    img, scaled = self.rm.decode_image(path, size)
+                except Exception as e:
+                    print(f"이미지 로드 오류 ({name}): {e}")
+            self._results.put((name, size, img, scaled, path))
+
+    def pump(self):
+        """디코드가 끝난 이미지를 변환해 캐시에 등록하고, 전체 완료 여부를 반환합니다."""
+        while True:
+            try:
+                name, size, img, scaled, path = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if img is None:
+                self.rm.get_image(name, size)  # 파일이 없으면 기존 대체 이미지 생성
+            else:
+                self.rm.finish_image(self.rm.cache_key(name, size), img, size, scaled, path)
+            self.loaded += 1
+        return self.done
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.loaded >= self.total
 
 # -----------------------------
 # 3. ScreenManager
 # -----------------------------
 class ScreenManager:
-    def __init__(self): self.current = None
-    def set(self, screen_obj): self.current = screen_obj
+    def __init__(self):
+        self.current = None
+        self.quality = QualityGovernor()  # 모든 화면이 공유하는 그래픽 품질 단계
+        self.sim_thread = SIM_THREAD      # 게임 화면에서 시뮬레이션 스레드 사용 여부
+        self.render_scale = RENDER_SCALE  # 게임 월드를 그릴 내부 해상도 배율
+        self.gc = GcPolicy()              # 수집 시점 조절 (화면 전환/오버레이에서 전체 수집)
+        self.screens = {}                 # 화면 풀: 클래스 -> 재사용할 화면 객체
+        self.culler = ViewportCuller()    # 화면 밖 엔티티 컬링 (세션 누적 그린/생략 수를 종료 시 기록)
+    def show(self, cls, rm, audio, *args):
+        """풀에서 cls 화면을 꺼내(처음이면 생성) reset(*args)으로 준비한 뒤 전환합니다."""
+        screen_obj = self.screens.get(cls)
+        if screen_obj is None: screen_obj = cls(self, rm, audio)
+        if hasattr(screen_obj, "reset"): screen_obj.reset(*args)
+        self.set(screen_obj)
+    def set(self, screen_obj):
+        if screen_obj is self.current: return
+        # 이전 화면 퇴장 처리 (고정해 둔 이미지 핸들 해제 등)
+        if self.current is not None and hasattr(self.current, "exit"): self.current.exit()
+        self.current = screen_obj
+        self.screens[type(screen_obj)] = screen_obj
+        if hasattr(screen_obj, "enter"): screen_obj.enter()
+        # 이전 화면이 남긴 객체를 전환 시점에 수거하고, 게임 화면 여부에 맞춰 임계값 변경
+        self.gc.transition(getattr(screen_obj, "gameplay", False))
+    def close(self):
+        """프로그램 종료 시 현재 화면을 정리합니다 (close가 있으면 close, 없으면 exit: 시뮬레이션 스레드 정지, 핸들 해제)."""
+        cur = self.current
+        if cur is not None:
+            if hasattr(cur, "close"): cur.close()
+            elif hasattr(cur, "exit"): cur.exit()
+        self.current = None
     def handle_event(self, event):
         if self.current: self.current.handle_event(event)
     def update(self, dt):
@@ -117,7 +500,154 @@ class ScreenManager:
         if self.current: self.current.draw(surf)
 
 # -----------------------------
-# 4. Button & UI Helpers
+# 4. ViewportCuller
+# -----------------------------
+class ViewportCuller:
+    """카메라 영역(+여유 마진)을 계산하고, 그린/생략한 엔티티 수를 집계합니다."""
+    def __init__(self, margin=128):
+        # 마진은 가장 큰 스프라이트(보스 150px)와 보스 체력바(200px)가 잘리지 않을 만큼 확보
+        self.margin = margin
+        self.view = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.drawn = 0
+        self.culled = 0
+        self.total_drawn = 0
+        self.total_culled = 0
+
+    def begin(self, cam):
+        """프레임 시작 시 카메라 기준 조회 영역을 갱신하고 프레임 카운터를 초기화합니다."""
+        m = self.margin
+        self.view.update(int(cam.x) - m, int(cam.y) - m, WIDTH + m * 2, HEIGHT + m * 2)
+        self.drawn = 0
+        self.culled = 0
+        return self.view
+
+    def record(self, visible_count, total_count):
+        self.drawn += visible_count
+        self.culled += total_count - visible_count
+        self.total_drawn += visible_count
+        self.total_culled += total_count - visible_count
+
+    def summary(self):
+        """세션 누적 그린/생략 수와 생략 비율 (프레임 시간 기록에 함께 저장)."""
+        total = self.total_drawn + self.total_culled
+        return {"drawn": self.total_drawn, "culled": self.total_culled,
+                "culled_ratio": round(self.total_culled / total, 3) if total else 0.0}
+
+# -----------------------------
+# 4-1. QualityGovernor
+# -----------------------------
+# minor_hp_bars: 일반 몬스터 체력바, fade: 투사체 투명도 감소, fire_rotate: 화염 투사체 회전,
+# lightning_detail: 번개 이중선, shield_aura: 보호막 반투명 원, max_effects: 그릴 투사체/번개 최대 수,
+# max_particles: 그릴 파티클 최대 수 (None이면 전부)
+QualityTier = namedtuple("QualityTier", "name minor_hp_bars fade fire_rotate lightning_detail shield_aura max_effects max_particles")
+QUALITY_TIERS = (
+    QualityTier("높음", True, True, True, True, True, None, None),
+    QualityTier("보통", False, False, True, True, True, None, 8000),
+    QualityTier("낮음", False, False, False, False, False, 120, 3000),
+    QualityTier("최저", False, False, False, False, False, 40, 800),
+)
+
+class QualityGovernor:
+    """최근 프레임 작업 시간 평균을 보고 그래픽 품질 단계를 조절합니다.
+
+    낮추는 기준과 높이는 기준을 따로 두고, 단계를 바꾼 뒤에는 QUALITY_HOLD초 동안
+    새 단계의 측정값을 모은 다음에만 다시 판단해 단계가 오락가락하지 않게 합니다.
+    """
+    def __init__(self, budget_ms=1000.0 / FPS, window=QUALITY_WINDOW, adaptive=QUALITY_ADAPTIVE):
+        self.budget_ms = budget_ms
+        self.adaptive = adaptive
+        self.samples = deque(maxlen=window)
+        self.total = 0.0
+        self.level = 0
+        self.tier = QUALITY_TIERS[0]
+        self.hold = 0.0
+        self.changes = 0
+
+    @property
+    def avg_ms(self):
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    def sample(self, work_ms, dt):
+        """프레임마다 호출: work_ms는 대기 시간을 뺀 실제 작업 시간 (Clock.get_rawtime)."""
+        if len(self.samples) == self.samples.maxlen: self.total -= self.samples[0]
+        self.samples.append(work_ms)
+        self.total += work_ms
+        if not self.adaptive: return
+        self.hold -= dt
+        if self.hold > 0 or len(self.samples) < self.samples.maxlen: return
+
+        avg = self.avg_ms
+        if avg > self.budget_ms * QUALITY_DOWN_RATIO and self.level < len(QUALITY_TIERS) - 1:
+            self.set_level(self.level + 1)
+        elif avg < self.budget_ms * QUALITY_UP_RATIO and self.level > 0:
+            self.set_level(self.level - 1)
+
+    def set_level(self, level):
+        self.level = level
+        self.tier = QUALITY_TIERS[level]
+        self.changes += 1
+        # 새 단계의 비용만으로 다시 평균을 내도록 측정값을 비움
+        self.hold = QUALITY_HOLD
+        self.samples.clear()
+        self.total = 0.0
+
+# -----------------------------
+# 4-2. RenderScaler
+# -----------------------------
+class RenderScaler:
+    """게임 월드를 내부 해상도(화면 크기 x scale) 표면에 그린 뒤 화면 크기로 늘려 출력합니다.
+
+    월드 좌표와 입력(마우스) 좌표는 그대로 화면 좌표계를 쓰고, 그리는 순간에만
+    (좌표 - 카메라) * scale로 변환합니다. 스프라이트는 처음 그릴 때 scale배로 줄인 사본을 캐시하며,
+    scale이 1이면 내부 표면 없이 화면에 바로 그립니다.
+    """
+    def __init__(self, scale=RENDER_SCALE):
+        self.scale = scale
+        self.native = scale == 1.0
+        self.size = (max(1, round(WIDTH * scale)), max(1, round(HEIGHT * scale)))
+        self.x = self.y = 0.0
+        self.surface = None
+        self.sprites = {}  # id(원본) -> (원본, 축소본)
+
+    def clear(self):
+        """축소 스프라이트 캐시를 비웁니다 (원본 참조가 남아 ResourceManager가 내보낸 이미지를 붙잡지 않도록)."""
+        self.sprites.clear()
+
+    def begin(self, screen, cam):
+        """프레임 시작: 카메라 위치를 기록하고 월드를 그릴 표면을 반환합니다."""
+        self.x, self.y = cam.x, cam.y
+        if self.native: return screen
+        if self.surface is None: self.surface = pygame.Surface(self.size).convert(screen)
+        return self.surface
+
+    def present(self, screen):
+        """내부 표면을 화면 크기로 늘려 출력합니다 (이후 HUD는 화면에 직접 그림)."""
+        if not self.native: pygame.transform.scale(self.surface, screen.get_size(), screen)
+
+    def point(self, x, y):
+        return ((x - self.x) * self.scale, (y - self.y) * self.scale)
+
+    def rect(self, x, y, w, h):
+        s = self.scale
+        return pygame.Rect(round((x - self.x) * s), round((y - self.y) * s), round(w * s), round(h * s))
+
+    def length(self, v, minimum=1):
+        return v if self.native else max(minimum, round(v * self.scale))
+
+    def sprite(self, img):
+        if self.native: return img
+        entry = self.sprites.get(id(img))
+        if entry is None or entry[0] is not img:
+            w, h = img.get_size()
+            size = (max(1, round(w * self.scale)), max(1, round(h * self.scale)))
+            # 컬러키 스프라이트는 가장자리에 키 색이 섞이지 않도록 최근접 축소
+            smooth = img.get_colorkey() is None and img.get_bitsize() in (24, 32)
+            entry = (img, (pygame.transform.smoothscale if smooth else pygame.transform.scale)(img, size))
+            self.sprites[id(img)] = entry
+        return entry[1]
+
+# -----------------------------
+# 5. Button & UI Helpers
 # -----------------------------
 class Button:
     def __init__(self, rect, text, color, hover, font, text_color=WHITE, radius=14):
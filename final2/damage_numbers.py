@@ -0,0 +1,104 @@
+import copy
+import pygame
+from config import (WHITE, YELLOW, DMG_TEXT_CAPACITY, DMG_TEXT_COALESCE,
+                    DMG_TEXT_LIFE, DMG_TEXT_RISE)
+
+# 시간이 지날수록 흐려지도록 미리 만들어 두는 알파 단계
+ATLAS_ALPHAS = (255, 190, 120, 60)
+BIG_HIT = 100  # 이 값 이상이면 노란색 숫자
+
+class DigitAtlas:
+    """0~9 숫자를 색상/알파 단계별로 한 번만 렌더링해 두고 조합해서 그립니다."""
+    def __init__(self, font):
+        self.glyphs = {}
+        for color in (WHITE, YELLOW):
+            for alpha in ATLAS_ALPHAS:
+                row = []
+                for d in "0123456789":
+                    g = font.render(d, True, color)
+                    outline = font.render(d, True, (0, 0, 0))
+                    s = pygame.Surface((g.get_width() + 2, g.get_height() + 2), pygame.SRCALPHA)
+                    s.blit(outline, (2, 2)); s.blit(g, (0, 0))
+                    s.set_alpha(alpha)
+                    row.append(s.convert_alpha() if pygame.display.get_surface() else s)
+                self.glyphs[(color, alpha)] = row
+        self.height = self.glyphs[(WHITE, 255)][0].get_height()
+
+    def draw_number(self, surf, number, center, color, alpha):
+        row = self.glyphs[(color, alpha)]
+        digits = [row[ord(ch) - 48] for ch in str(number)]
+        x = int(center[0] - sum(g.get_width() for g in digits) / 2)
+        y = int(center[1] - self.height / 2)
+        for g in digits:
+            surf.blit(g, (x, y))
+            x += g.get_width() - 2
+
+class DamageNumbers:
+    """고정 크기 링 버퍼에 떠오르는 데미지 숫자를 보관합니다.
+
+    같은 적(key)이 합산 시간 안에 다시 맞으면 기존 숫자에 더하고, 버퍼가 가득 차면
+    가장 오래된 칸을 덮어씁니다. 초당 타격 수와 무관하게 프레임당 비용은
+    capacity개 숫자로 제한됩니다.
+    """
+    def __init__(self, capacity=DMG_TEXT_CAPACITY):
+        self.capacity = capacity
+        self.keys = [None] * capacity
+        self.values = [0.0] * capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.born = [float("-inf")] * capacity
+        self.slot_of = {}
+        self.head = 0
+        self.now = 0.0
+        self.atlas = None
+
+    def clear(self):
+        self.keys = [None] * self.capacity
+        self.born = [float("-inf")] * self.capacity
+        self.slot_of.clear()
+        self.head = 0
+        self.now = 0.0
+
+    def update(self, dt):
+        self.now += dt
+
+    def add(self, key, pos, amount):
+        slot = self.slot_of.get(key)
+        if slot is not None and self.now - self.born[slot] < DMG_TEXT_COALESCE:
+            self.values[slot] += amount
+            self.xs[slot] = pos.x; self.ys[slot] = pos.y
+            return
+
+        # 가장 오래된 칸 재사용
+        slot = self.head
+        self.head = (self.head + 1) % self.capacity
+        old = self.keys[slot]
+        if old is not None and self.slot_of.get(old) == slot:
+            del self.slot_of[old]
+        self.keys[slot] = key
+        self.values[slot] = amount
+        self.xs[slot] = pos.x; self.ys[slot] = pos.y
+        self.born[slot] = self.now
+        self.slot_of[key] = slot
+
+    def snapshot(self):
+        """그리기용 사본: 링 버퍼 값만 복사하고 숫자 아틀라스는 공유합니다."""
+        v = copy.copy(self)
+        v.values, v.xs, v.ys, v.born = list(self.values), list(self.xs), list(self.ys), list(self.born)
+        return v
+
+    def prepare_draw(self):
+        if self.atlas is None:
+            self.atlas = DigitAtlas(pygame.font.SysFont("malgungothic", 18, bold=True))
+
+    def draw(self, surf, cam):
+        self.prepare_draw()
+        steps = len(ATLAS_ALPHAS)
+        for i in range(self.capacity):
+            age = self.now - self.born[i]
+            if age >= DMG_TEXT_LIFE: continue
+            t = age / DMG_TEXT_LIFE
+            value = max(1, int(round(self.values[i])))
+            color = YELLOW if value >= BIG_HIT else WHITE
+            pos = (self.xs[i] - cam.x, self.ys[i] - cam.y - 24 - DMG_TEXT_RISE * t)
+            self.atlas.draw_number(surf, value, pos, color, ATLAS_ALPHAS[min(steps - 1, int(t * steps))])
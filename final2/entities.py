@@ -1,5 +1,6 @@
 import pygame
 import math
+import itertools
 from config import WIDTH, HEIGHT, exp_need_for_level
 
 # -----------------------------
@@ -7,9 +8,16 @@ from config import WIDTH, HEIGHT, exp_need_for_level
 # -----------------------------
 class Player:
     def __init__(self, config):
-        self.pos = pygame.Vector2(WIDTH * 0.5, HEIGHT * 0.55)
+        self.pos = pygame.Vector2()
         # 스킬 시스템 조준을 위해 화면 위치 정보 추가
-        self.screen_pos = pygame.Vector2(self.pos.x, self.pos.y)
+        self.screen_pos = pygame.Vector2()
+        self.reset(config)
+
+    def reset(self, config):
+        """새 판 시작 시 같은 객체를 처음 상태로 되돌립니다."""
+        self.pos.update(WIDTH * 0.5, HEIGHT * 0.55)
+        self.screen_pos.update(self.pos)
+        self.aim_pos = None  # 조준 지점 (None이면 마우스 커서, 시뮬레이터 봇이 지정)
         self.radius = 18
         self.vel = float(config.get("VEL", 240))
         self.dmg = float(config.get("DMG", 1.0))
@@ -49,19 +57,52 @@ class Player:
             self.exp_need = exp_need_for_level(self.level + 1)
         return leveled_up
 
+_enemy_uid = itertools.count(1)
+
 class Enemy:
     def __init__(self, kind, pos, hp, exp_reward, img, radius=18):
-        self.kind = kind
         self.pos = pygame.Vector2(pos)
+        self.random_vel = pygame.Vector2(0, 0)
+        self.reset(kind, pos, hp, exp_reward, img, radius)
+
+    def reset(self, kind, pos, hp, exp_reward, img, radius=18):
+        """풀에서 재사용할 때 새로 만든 것과 같은 상태로 되돌립니다."""
+        self.uid = next(_enemy_uid)  # 객체 재사용과 무관한 고유 번호 (데미지 숫자 합산 키)
+        self.kind = kind
+        self.pos.update(pos)
         self.max_hp = hp
         self.hp = hp
+        self.prev_hp = hp  # 직전 틱의 체력 (틱 단위 피해량 계산용)
         self.exp_reward = exp_reward
         self.img = img
         self.radius = radius
         
         self.speed = 100
-        self.random_vel = pygame.Vector2(0, 0)
+        self.random_vel.update(0, 0)
         self.random_change_t = 0.0
+        # 이전 생애에서 붙은 동적 속성 제거 (보상 지급 여부, 보호막 감속 전 속도)
+        self._rewarded = False
+        self.__dict__.pop("original_speed", None)
 
     def alive(self):
-        return self.hp > 0
\ No newline at end of file
+        return self.hp > 0
+
+class EnemyPool:
+    """죽은 Enemy 객체를 모아 두었다가 다음 스폰에 재사용합니다."""
+    def __init__(self):
+        self.free = []
+
+    def reserve(self, n):
+        """스폰 중 할당이 없도록 n개까지 미리 만들어 둡니다."""
+        while len(self.free) < n:
+            self.free.append(Enemy("spider", (0, 0), 0, 0, None))
+
+    def acquire(self, kind, pos, hp, exp_reward, img, radius=18):
+        if self.free:
+            e = self.free.pop()
+            e.reset(kind, pos, hp, exp_reward, img, radius)
+            return e
+        return Enemy(kind, pos, hp, exp_reward, img, radius)
+
+    def release(self, e):
+        self.free.append(e)
\ No newline at end of file
@@ -0,0 +1,119 @@
+import copy
+import numpy as np
+import pygame
+from config import (ORB_CAPACITY, ORB_MERGE_CAP, ORB_MERGE_CELL,
+                    ORB_MAGNET_RADIUS, ORB_PICKUP_RADIUS, ORB_SPEED)
+
+# 구슬 가치 구간별 스프라이트 (구간 상한, 반지름, 색상)
+ORB_TIERS = (
+    (50, 5, (80, 170, 255)),
+    (200, 7, (60, 210, 120)),
+    (800, 9, (190, 110, 255)),
+    (None, 12, (255, 220, 80)),
+)
+
+class ExpOrbPool:
+    """경험치 구슬을 고정 크기 NumPy 배열로 관리합니다.
+
+    살아있는 구슬은 항상 배열 앞쪽 [0:count]에 모여 있으며, 자석 이동과 획득 판정은
+    한 번의 벡터 연산으로 처리합니다. 개수가 merge_cap을 넘으면 같은 격자 칸의
+    구슬을 가치 합계가 같은 하나의 구슬로 합쳐서 프레임 비용을 일정하게 유지합니다.
+    """
+    def __init__(self, capacity=ORB_CAPACITY, merge_cap=ORB_MERGE_CAP):
+        self.capacity = capacity
+        self.merge_cap = merge_cap
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.value = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        self.thresholds = np.array([t[0] for t in ORB_TIERS[:-1]], dtype=np.int64)
+        self.sprites = None
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y, value):
+        if self.count >= self.capacity:
+            self.merge(max_count=self.capacity // 2)
+        i = self.count
+        self.pos[i, 0] = x
+        self.pos[i, 1] = y
+        self.value[i] = value
+        self.count += 1
+
+    def update(self, dt, player_pos):
+        """자석 이동 및 획득 처리 후 이번 프레임에 획득한 경험치 합계를 반환합니다."""
+        n = self.count
+        if n == 0: return 0
+        pos = self.pos[:n]
+        delta = np.array((player_pos.x, player_pos.y)) - pos
+        dist_sq = np.einsum("ij,ij->i", delta, delta)
+
+        # 자석 범위 안의 구슬은 플레이어 방향으로 이동 (목표를 지나치지 않도록 거리로 제한)
+        pulled = dist_sq < ORB_MAGNET_RADIUS ** 2
+        if pulled.any():
+            dist = np.sqrt(dist_sq[pulled])
+            step = np.minimum(ORB_SPEED * dt, dist) / np.maximum(dist, 1e-6)
+            pos[pulled] += delta[pulled] * step[:, None]
+
+        picked = dist_sq <= ORB_PICKUP_RADIUS ** 2
+        gained = 0
+        if picked.any():
+            gained = int(self.value[:n][picked].sum())
+            keep = ~picked
+            k = int(keep.sum())
+            self.pos[:k] = pos[keep]
+            self.value[:k] = self.value[:n][keep]
+            self.count = k
+
+        if self.count > self.merge_cap:
+            self.merge()
+        return gained
+
+    def merge(self, max_count=None):
+        """같은 격자 칸에 있는 구슬을 가치 가중 중심 위치의 구슬 하나로 합칩니다."""
+        max_count = self.merge_cap if max_count is None else max_count
+        cell = float(ORB_MERGE_CELL)
+        while self.count > max_count:
+            n = self.count
+            pos, value = self.pos[:n], self.value[:n]
+            cells = np.floor(pos / cell).astype(np.int64)
+            _, inv = np.unique(cells, axis=0, return_inverse=True)
+            inv = inv.ravel()
+            total = np.bincount(inv, weights=value)
+            k = len(total)
+            self.pos[:k, 0] = np.bincount(inv, weights=pos[:, 0] * value) / total
+            self.pos[:k, 1] = np.bincount(inv, weights=pos[:, 1] * value) / total
+            self.value[:k] = np.rint(total).astype(np.int64)
+            self.count = k
+            # 모두 다른 칸에 흩어져 있으면 칸을 키워서 다시 합침
+            cell *= 2
+
+    def snapshot(self):
+        """그리기용 사본: 살아있는 구슬 배열만 복사하고 스프라이트는 공유합니다."""
+        v = copy.copy(self)
+        n = self.count
+        v.pos = self.pos[:n].copy()
+        v.value = self.value[:n].copy()
+        return v
+
+    def prepare_draw(self):
+        if self.sprites is None: self._build_sprites()
+
+    def _build_sprites(self):
+        self.sprites = []
+        for _, r, color in ORB_TIERS:
+            s = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, color, (r + 1, r + 1), r)
+            pygame.draw.circle(s, (245, 245, 245), (r + 1, r + 1), r, 1)
+            self.sprites.append(s.convert_alpha() if pygame.display.get_surface() else s)
+
+    def draw(self, surf, view):
+        n = self.count
+        if n == 0: return
+        self.prepare_draw()
+        sprites = [view.sprite(s) for s in self.sprites]
+        tiers = np.searchsorted(self.thresholds, self.value[:n], side="right")
+        half = np.array([s.get_width() // 2 for s in sprites])[tiers]
+        xs = ((self.pos[:n, 0] - view.x) * view.scale - half).astype(np.int32).tolist()
+        ys = ((self.pos[:n, 1] - view.y) * view.scale - half).astype(np.int32).tolist()
+        surf.blits([(sprites[t], (x, y)) for t, x, y in zip(tiers.tolist(), xs, ys)], False)
@@ -1,37 +1,58 @@
 import math
+import bisect
 import pygame
 import random
-from config import (WIDTH, HEIGHT, SFX_MIDBOSS_SPAWN, BGM_FINAL_BOSS, DIFFICULTY_SETTINGS)
-from entities import Enemy, Player
+from config import (WIDTH, HEIGHT, FPS, SFX_MIDBOSS_SPAWN, BGM_FINAL_BOSS, DIFFICULTY_SETTINGS,
+                    DEV_MODE, WAVES_RELOAD_INTERVAL, PARTICLE_FIRE, PARTICLE_DEATH, PARTICLE_BOSS_DEATH)
+from entities import EnemyPool, Player
+from exp_orbs import ExpOrbPool
+from damage_numbers import DamageNumbers
+from particles import ParticleSystem
+from scheduler import EventScheduler
+from waves import load_timeline, TimelineWatcher
 
 class WaveManager:
     """적 스폰과 관련된 시간 및 웨이브 상태를 관리하며, 사운드 트리거를 포함합니다."""
-    def __init__(self, difficulty="normal"):
+    def __init__(self, difficulty="normal", scheduler=None, overrides=None):
         self.difficulty = difficulty
+        # 보스 제한 시간은 스케줄러 이벤트로 처리하므로 없으면 전용 스케줄러를 만듦
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
+        self.overrides = overrides or {}  # 난이도 값 일부 덮어쓰기 (밸런스 시뮬레이터용)
+        # 보스 등장 시각 / 스폰 비율 곡선은 data/waves.json에서 읽어 미리 컴파일
+        self.timeline = load_timeline()
+        self.watcher = TimelineWatcher() if DEV_MODE else None
+        self.actions = {"boss": self._spawn_boss, "prepare_bgm": self._prepare_bgm}
         self.reset()
 
     def reset(self):
         self.elapsed = 0.0
-        self.total_time = 300.0 # 5분 제한
+        self.total_time = self.timeline.total_time # 5분 제한
         self.prev_second = -1
         self.midboss_spawned = False
         self.finalboss_spawned = False
         self.boss_deadline = None
         self.active_boss_kind = None
         self.boss_time_over = False
+        self.deadline_event = None
+        self.reload_t = 0.0  # 개발 모드 웨이브 파일 변경 확인 타이머
 
         # 난이도 설정 적용
         self._apply_difficulty()
+        self._compile_rates()
+        self.cursor = 0  # 다음에 실행할 타임라인 이벤트 위치
+        self.rate_sec = 0
+        self.spawn_rate = self.rate_table[0]
+        self._draw_next_spawn()
 
     def _apply_difficulty(self):
         """config.py에서 난이도 설정을 가져와 적용합니다."""
         # 설정이 없으면 normal을 기본값으로 사용
         settings = DIFFICULTY_SETTINGS.get(self.difficulty, DIFFICULTY_SETTINGS["normal"])
+        if self.overrides: settings = {**settings, **self.overrides}
         
         # ✅ 계단식 스폰 확률을 위한 시작/끝 값 로드
         self.spawn_prob_start = settings["spawn_prob_start"]
         self.spawn_prob_end = settings["spawn_prob_end"]
-        self.spawn_prob = self.spawn_prob_start # 초기값 설정
 
         self.boss_time_limit = settings["boss_time_limit"]
         self.max_enemies_alive = settings["max_enemies"]
@@ -43,58 +64,86 @@ class WaveManager:
         self.mob_damage = settings["mob_damage"]
         self.boss_damage = settings["boss_damage"]
 
+    def _compile_rates(self):
+        """타임라인의 초 단위 비율 곡선을 이 난이도의 초당 스폰 수 표로 변환합니다."""
+        # 스폰 확률은 60FPS 기준 '프레임당' 값이므로 FPS를 곱해 '초당' 스폰 수로 환산
+        start, end = self.spawn_prob_start, self.spawn_prob_end
+        self.rate_table = [(start + (end - start) * r) * FPS for r in self.timeline.spawn_ratio]
+
     def update(self, dt, gs, controller):
         self.elapsed += dt
-        
-        # ✅ [추가] 계단식 스폰 확률 증가 로직 (1분마다 단계 상승)
-        # 총 5분(300초) 게임이므로, 0~4단계 (총 5단계)
-        # 0분대: 0단계, 1분대: 1단계 ... 4분대: 4단계
-        current_phase = int(self.elapsed / 60.0)
-        max_phases = 4 # 0, 1, 2, 3, 4 (총 5단계)
-        
-        # 범위를 0~4로 제한
-        current_phase = min(current_phase, max_phases)
-        
-        # 선형 보간 (Lerp) 비율 계산 (0.0 ~ 1.0)
-        ratio = current_phase / float(max_phases)
-        
-        # 현재 스폰 확률 갱신
-        self.spawn_prob = self.spawn_prob_start + (self.spawn_prob_end - self.spawn_prob_start) * ratio
-
-        # 매 프레임 확률 기반 스폰 로직
-        if random.random() < self.spawn_prob:
-            self._spawn_routine(gs, controller)
-
-        # 보스 스폰 체크 (시간 기반)
-        if not self.midboss_spawned and self.elapsed >= 120:
-            self._spawn_boss(gs, controller, "midboss")
-        if not self.finalboss_spawned and self.elapsed >= 240:
-            self._spawn_boss(gs, controller, "finalboss")
-            
-        # 보스 제한 시간 체크
-        if self.boss_deadline and self.elapsed >= self.boss_deadline:
-            self.boss_time_over = True
-
-    def _spawn_routine(self, gs, controller):
-        if len(controller.enemies) < self.max_enemies_alive:
-            # 종류 결정: 2초 단위로 종류가 바뀌는 기존 로직의 감성 유지
-            current_sec = int(self.elapsed)
-            kind = "spider" if current_sec % 2 == 1 else "skull"
-            
+        if self.watcher: self._poll_reload(dt)
+
+        # 초가 바뀔 때만 미리 계산된 표에서 스폰 비율을 읽음 (바뀌었으면 다음 스폰 시각을 새 비율로 다시 뽑음)
+        sec = int(self.elapsed)
+        if sec != self.rate_sec:
+            self.rate_sec = sec
+            rate = self.rate_table[min(sec, len(self.rate_table) - 1)]
+            if rate != self.spawn_rate:
+                self.spawn_rate = rate
+                self._draw_next_spawn()
+
+        # 시간 기반 스폰 (포아송 과정): 프레임 수와 무관하게 초당 spawn_rate마리
+        # 이번 틱까지 도래한 스폰을 모두 세어 한 번에 생성
+        count = 0
+        while self.next_spawn_t <= self.elapsed:
+            count += 1
+            self.next_spawn_t += random.expovariate(self.spawn_rate)
+        if count: self._spawn_batch(gs, controller, count)
+
+        # 타임라인 이벤트 (보스 등장 등): 시각순으로 정렬되어 있으므로 커서만 전진
+        events = self.timeline.events
+        while self.cursor < len(events) and events[self.cursor].time <= self.elapsed:
+            ev = events[self.cursor]
+            self.cursor += 1
+            self.actions[ev.action](gs, controller, ev.arg)
+
+    def _poll_reload(self, dt):
+        self.reload_t += dt
+        if self.reload_t < WAVES_RELOAD_INTERVAL: return
+        self.reload_t = 0.0
+        timeline = self.watcher.poll()
+        if timeline is None: return
+        # 이미 지난 이벤트는 다시 실행하지 않도록 커서를 현재 시각 뒤로 맞춤
+        self.timeline = timeline
+        self.total_time = timeline.total_time
+        self.cursor = bisect.bisect_right(timeline.event_times, self.elapsed)
+        self._compile_rates()
+        self.rate_sec = -1  # 다음 틱에 새 비율 적용
+
+    def _prepare_bgm(self, gs, controller, filename):
+        gs.audio.prepare_bgm(filename)
+
+    def _draw_next_spawn(self):
+        """지수분포 도착 간격으로 다음 스폰 시각을 정합니다 (비율이 0이면 스폰 없음)."""
+        if self.spawn_rate > 0:
+            self.next_spawn_t = self.elapsed + random.expovariate(self.spawn_rate)
+        else:
+            self.next_spawn_t = math.inf
+
+    def _spawn_batch(self, gs, controller, count):
+        # 최대 적 수를 넘지 않는 만큼만 풀에서 꺼내 생성
+        count = min(count, self.max_enemies_alive - len(controller.enemies))
+        if count <= 0: return
+
+        # 종류 결정: 1초마다 mob_cycle 순서대로 종류가 바뀜
+        cycle = self.timeline.mob_cycle
+        kind = cycle[int(self.elapsed) % len(cycle)]
+        img = gs.img_spider if kind == "spider" else gs.img_skull
+        # 경험치 계산: Config의 상수값 사용
+        calculated_exp = self.exp_drop
+        acquire = controller.enemy_pool.acquire
+        margin = 30
+
+        for _ in range(count):
             side = random.choice(["top", "bottom", "left", "right"])
-            margin = 30
             if side == "top": pos = (random.randint(margin, WIDTH - margin), -margin)
             elif side == "bottom": pos = (random.randint(margin, WIDTH - margin), HEIGHT + margin)
             elif side == "left": pos = (-margin, random.randint(80, HEIGHT - margin))
             else: pos = (WIDTH + margin, random.randint(80, HEIGHT - margin))
                 
-            img = gs.img_spider if kind == "spider" else gs.img_skull
-            
-            # 경험치 계산: Config의 상수값 사용
-            calculated_exp = self.exp_drop
-            
             # config에서 가져온 체력 적용
-            controller.enemies.append(Enemy(kind, pos, self.mob_hp, calculated_exp, img))
+            controller.enemies.append(acquire(kind, pos, self.mob_hp, calculated_exp, img))
 
     def _spawn_boss(self, gs, controller, kind):
         is_mid = (kind == "midboss")
@@ -111,7 +160,7 @@ class WaveManager:
             offset_x = (i - (self.boss_count - 1) / 2) * 150
             spawn_pos = (WIDTH * 0.7 + offset_x, HEIGHT * 0.4)
             
-            e = Enemy(kind, spawn_pos, 
+            e = controller.enemy_pool.acquire(kind, spawn_pos, 
                       base_hp, 
                       500 if is_mid else 0, 
                       gs.img_midboss if is_mid else gs.img_finalboss, 
@@ -122,6 +171,9 @@ class WaveManager:
         self.active_boss_kind = kind
         self.boss_deadline = self.elapsed + self.boss_time_limit
         self.boss_time_over = False
+        self.scheduler.cancel(self.deadline_event)
+        # elapsed는 이번 틱만큼 이미 진행됐고 scheduler.now는 아직이므로 상대 시간이 아닌 절대 시각으로 등록
+        self.deadline_event = self.scheduler.schedule_at(self.boss_deadline, self._on_boss_deadline)
         
         # 사운드 제어 (한 번만 재생)
         if is_mid:
@@ -131,30 +183,64 @@ class WaveManager:
             gs.audio.play_bgm(BGM_FINAL_BOSS)
             self.finalboss_spawned = True
 
+    def _on_boss_deadline(self, gs, controller):
+        self.deadline_event = None
+        self.boss_time_over = True
+
+    def clear_boss_deadline(self):
+        """보스를 모두 처치했을 때 제한 시간 이벤트를 취소합니다."""
+        self.scheduler.cancel(self.deadline_event)
+        self.deadline_event = None
+        self.boss_deadline = None
+        self.active_boss_kind = None
+        self.boss_time_over = False
+
 class GameController:
     def __init__(self, rm, player_config):
         self.rm = rm
         self.player_config = player_config
         # 플레이어 설정에서 난이도 가져오기 (기본값 normal)
         difficulty = player_config.get("DIFFICULTY", "normal")
-        self.wave_mgr = WaveManager(difficulty)
+        # 스킬 쿨다운, 보스 등장/제한 시간, 효과 만료를 처리하는 시뮬레이션 시간 스케줄러
+        self.scheduler = EventScheduler()
+        self.wave_mgr = WaveManager(difficulty, self.scheduler, player_config.get("DIFFICULTY_OVERRIDES"))
+        self.enemy_pool = EnemyPool()
+        self.enemies = []
+        self.skill_projectiles = []
+        self.orbs = ExpOrbPool()
+        self.damage_numbers = DamageNumbers()
+        self.particles = ParticleSystem()
+        self.player = Player(player_config)
         self.reset()
 
-    def reset(self):
-        self.player = Player(self.player_config)
-        self.enemies = []
-        self.skill_projectiles = [] 
+    def reset(self, player_config=None):
+        """새 판 시작: 플레이어/적/투사체/구슬/파티클 저장소는 재사용하고 내용만 비웁니다.
+
+        player_config를 주면 캐릭터와 난이도도 바꿉니다 (GameScreen 재사용 시).
+        """
+        if player_config is not None:
+            self.player_config = player_config
+            self.wave_mgr.difficulty = player_config.get("DIFFICULTY", "normal")
+            self.wave_mgr.overrides = player_config.get("DIFFICULTY_OVERRIDES") or {}
+        self.player.reset(self.player_config)
+        for e in self.enemies: self.enemy_pool.release(e)
+        self.enemies.clear()
+        self.skill_projectiles.clear()
+        self.orbs.clear()
+        self.damage_numbers.clear()
+        self.particles.clear()
+        self.scheduler.clear()
         self.wave_mgr.reset()
+        # 최대 적 수만큼 미리 만들어 두어 스폰 시 객체 생성 비용이 없도록 함
+        self.enemy_pool.reserve(self.wave_mgr.max_enemies_alive)
 
-    def tick_logic(self, dt, gs):
+    def tick_logic(self, dt, gs, keys=None):
         self.wave_mgr.update(dt, gs, self)
-        
-        # 보스 시간 초과 시 게임 종료
-        if self.wave_mgr.boss_time_over:
-            gs.finish_game(False, "보스 처치 시간 초과!")
-            return
+        self.damage_numbers.update(dt)
+        self.particles.update(dt)
 
-        keys = pygame.key.get_pressed()
+        # 입력이 주어지지 않으면 키보드 상태 사용 (헤드리스 시뮬레이션은 봇 입력을 전달)
+        if keys is None: keys = pygame.key.get_pressed()
         self.player.move(dt, keys)
         
         # 적 이동 로직
@@ -173,6 +259,14 @@ class GameController:
                 e.pos.x = max(60, min(WIDTH - 60, e.pos.x))
                 e.pos.y = max(110, min(HEIGHT - 60, e.pos.y))
 
+        # 스킬 쿨다운/보스 제한 시간 이벤트 처리 (스킬은 이동이 끝난 위치를 기준으로 발동)
+        self.scheduler.advance(dt, gs, self)
+
+        # 보스 시간 초과 시 게임 종료
+        if self.wave_mgr.boss_time_over:
+            gs.finish_game(False, "보스 처치 시간 초과!")
+            return
+
         # 스킬 업데이트
         for s in gs.skills:
             if s.level > 0: s.update(dt, self.player, self.enemies, self.skill_projectiles)
@@ -202,6 +296,8 @@ class GameController:
                     
                     if getattr(p, 'is_fire', False):
                         ex_radius = getattr(p, 'explosion_radius', 60)
+                        # 폭발 범위가 클수록 파편이 멀리 퍼짐
+                        self.particles.emit(p.pos.x, p.pos.y, PARTICLE_FIRE, "fire", speed=(ex_radius, ex_radius * 4))
                         for target in self.enemies:
                             if target.alive() and (target.pos - p.pos).length_squared() <= ex_radius**2:
                                 target.hp -= actual_damage
@@ -215,7 +311,15 @@ class GameController:
                     self.skill_projectiles.remove(p)
 
         self._handle_collisions_and_rewards(dt, gs)
-        self.enemies = [e for e in self.enemies if e.alive()]
+        # 죽은 적은 풀로 돌려보내 다음 스폰에 재사용 (목록은 새로 만들지 않고 제자리에서 앞으로 당김)
+        enemies = self.enemies
+        n = 0
+        for e in enemies:
+            if e.alive():
+                enemies[n] = e
+                n += 1
+            else: self.enemy_pool.release(e)
+        del enemies[n:]
 
     def _handle_collisions_and_rewards(self, dt, gs):
         p_pos = self.player.pos
@@ -226,6 +330,12 @@ class GameController:
         bosses_alive = sum(1 for e in self.enemies if e.kind in ("midboss", "finalboss"))
 
         for e in self.enemies:
+            # 이번 틱에 받은 피해(투사체/폭발/번개/보호막 합계)를 데미지 숫자로 기록
+            dealt = e.prev_hp - e.hp
+            if dealt > 0:
+                self.damage_numbers.add(e.uid, e.pos, dealt)
+                e.prev_hp = e.hp
+
             if e.alive():
                 dist_sq = (e.pos - p_pos).length_squared()
                 min_dist = e.radius + p_rad
@@ -243,19 +353,26 @@ class GameController:
                     if dist_sq > 0: e.pos = p_pos + (e.pos - p_pos).normalize() * (min_dist + 2)
             
             if not e.alive() and not getattr(e, '_rewarded', False):
+                if e.kind in ("midboss", "finalboss"):
+                    self.particles.emit(e.pos.x, e.pos.y, PARTICLE_BOSS_DEATH, "boss", speed=(80, 420), life=(0.5, 1.2))
+                else:
+                    self.particles.emit(e.pos.x, e.pos.y, PARTICLE_DEATH, "death")
+                # 경험치는 즉시 지급하지 않고 처치 위치에 구슬로 떨어뜨림
                 if e.kind in ("spider", "skull"):
                     self.player.kills += 1
-                    if self.player.add_exp(e.exp_reward): leveled_up = True
+                    self.orbs.spawn(e.pos.x, e.pos.y, e.exp_reward)
                 elif e.kind == "midboss":
-                    if self.player.add_exp(800): leveled_up = True
+                    self.orbs.spawn(e.pos.x, e.pos.y, 800)
                     # 모든 보스가 죽었는지 체크
                     if bosses_alive <= 1: # 지금 죽은 녀석 포함이므로 1 이하
-                        self.wave_mgr.boss_deadline = None
-                        self.wave_mgr.active_boss_kind = None
-                        self.wave_mgr.boss_time_over = False
+                        self.wave_mgr.clear_boss_deadline()
                 elif e.kind == "finalboss":
                     if bosses_alive <= 1:
                         gs.finish_game(True, "최종 보스 처치!")
                 e._rewarded = True
 
+        # 경험치 구슬 자석 이동 및 획득
+        gained = self.orbs.update(dt, p_pos)
+        if gained and self.player.add_exp(gained): leveled_up = True
+
         if leveled_up: gs.trigger_level_up()
\ No newline at end of file
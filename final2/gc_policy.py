@@ -0,0 +1,76 @@
+import gc
+import time
+from config import GC_GAMEPLAY_THRESHOLD
+
+class GcPolicy:
+    """순환 GC가 전투 도중 아무 때나 큰(2세대) 수집을 하지 않도록 수집 시점을 조절합니다.
+
+    에셋 로드가 끝나면 gc.freeze()로 시작 시 만든 객체를 수집 대상에서 빼고, 게임 화면에서는
+    임계값을 높여 자동 수집 빈도를 줄입니다. 대신 레벨업/일시정지 오버레이와 화면 전환처럼
+    플레이가 멈춰 있는 순간에 전체 수집을 실행합니다. 모든 수집 시간은 gc.callbacks로 기록합니다.
+    """
+    def __init__(self, gameplay_threshold=GC_GAMEPLAY_THRESHOLD):
+        self.default_threshold = gc.get_threshold()
+        self.gameplay_threshold = gameplay_threshold
+        self.gameplay = False
+        self.frozen = 0                  # gc.freeze()로 고정한 객체 수
+        # 자동 수집 통계 (세대별 횟수, 합계 ms, 최대 ms)
+        self.auto_count = [0, 0, 0]
+        self.auto_ms = [0.0, 0.0, 0.0]
+        self.auto_max_ms = [0.0, 0.0, 0.0]
+        self.scheduled = []              # 예약 수집 기록 (사유, ms, 수거한 객체 수)
+        self._collecting = False
+        self._start = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None or self._collecting: return
+        ms = (time.perf_counter() - self._start) * 1000.0
+        self._start = None
+        g = info["generation"]
+        self.auto_count[g] += 1
+        self.auto_ms[g] += ms
+        self.auto_max_ms[g] = max(self.auto_max_ms[g], ms)
+
+    def collect(self, reason):
+        """플레이가 멈춘 시점에 전체 수집을 실행하고 소요 시간을 기록합니다."""
+        self._collecting = True
+        start = time.perf_counter()
+        try:
+            found = gc.collect()
+        finally:
+            self._collecting = False
+        ms = (time.perf_counter() - start) * 1000.0
+        self.scheduled.append((reason, ms, found))
+        return ms
+
+    def freeze(self):
+        """에셋 로드 완료 후: 남은 쓰레기를 치우고 현재 객체를 영구 세대로 옮깁니다."""
+        self.collect("에셋 로드 완료")
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+
+    def transition(self, gameplay):
+        """화면 전환 시 전체 수집 후, 게임 화면이면 높은 임계값, 아니면 기본 임계값을 적용합니다."""
+        self.collect("화면 전환")
+        self.gameplay = gameplay
+        gc.set_threshold(*(self.gameplay_threshold if gameplay else self.default_threshold))
+
+    def report(self):
+        lines = ["[gc] 수집 시간"]
+        lines.append(f"  고정(freeze) 객체 {self.frozen}개, 게임 중 임계값 {self.gameplay_threshold}")
+        for g in range(3):
+            n = self.auto_count[g]
+            avg = self.auto_ms[g] / n if n else 0.0
+            lines.append(f"  자동 {g}세대 {n:6d}회  합계 {self.auto_ms[g]:8.1f} ms  "
+                         f"평균 {avg:6.2f} ms  최대 {self.auto_max_ms[g]:6.2f} ms")
+        totals = {}
+        for reason, ms, found in self.scheduled:
+            n, total, worst, objs = totals.get(reason, (0, 0.0, 0.0, 0))
+            totals[reason] = (n + 1, total + ms, max(worst, ms), objs + found)
+        for reason, (n, total, worst, objs) in totals.items():
+            lines.append(f"  예약 {reason:<12} {n:4d}회  합계 {total:8.1f} ms  최대 {worst:6.2f} ms  수거 {objs}개")
+        return "\n".join(lines)
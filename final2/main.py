@@ -1,48 +1,146 @@
-import pygame
+import os
 import sys
-from config import WIDTH, HEIGHT, FPS
-from core import ResourceManager, ScreenManager, AudioManager
-from screens import StartScreen
-
-def main():
-    # Pygame 초기화
-    pygame.init()
-    pygame.font.init()
-    pygame.mixer.init() # 오디오 믹서 초기화
+import time
+import argparse
+from profiler import StartupProfiler
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MAGIC SURVIVOR")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="첫 프레임까지의 import/init/asset 구간별 시간을 출력합니다")
+    parser.add_argument("--check-startup", action="store_true",
+                        help="첫 프레임 후 종료하며, 시작 시간 예산을 넘으면 종료 코드 1을 반환합니다")
+    parser.add_argument("--startup-budget", type=float, default=None,
+                        help="시작 시간 예산(ms), 기본값은 config.STARTUP_BUDGET_MS")
+    parser.add_argument("--pacing", choices=("tick", "busy", "vsync", "hybrid"), default=None,
+                        help="프레임 대기 방식, 기본값은 config.FRAME_PACING")
+    parser.add_argument("--profile-gc", action="store_true",
+                        help="종료 시 GC 세대별 자동 수집 시간과 예약 수집 시간을 출력합니다")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="종료 시 이미지 캐시 상주 바이트/예산과 에셋별 사용량을 출력합니다")
+    parser.add_argument("--sim-thread", action="store_true",
+                        help="게임 로직을 별도 스레드에서 고정 주기로 실행합니다 (config.SIM_THREAD)")
+    parser.add_argument("--render-scale", type=float, default=None, choices=(0.5, 1.0),
+                        help="게임 월드를 그릴 내부 해상도 배율, 기본값은 config.RENDER_SCALE (HUD는 원래 해상도)")
+    return parser.parse_args(argv)
+
+def write_frame_log(frame_times, pacer, culler, log_dir):
+    """세션의 프레임 시간 히스토그램과 컬링 집계를 저장하고 요약을 출력합니다."""
+    path = os.path.join(log_dir, time.strftime("frametimes_%Y%m%d_%H%M%S.json"))
+    culling = culler.summary()
+    try:
+        s = frame_times.write(path, pacing=pacer.strategy, fps=pacer.fps, culling=culling)
+    except OSError as e:
+        print(f"프레임 시간 기록 저장 실패: {e}")
+        return
+    print(f"[frames] {pacer.strategy} {s['frames']}프레임  p50 {s['p50_ms']:.2f} / p95 {s['p95_ms']:.2f} / "
+          f"p99 {s['p99_ms']:.2f} ms  놓친 프레임 {s['missed_frames']}  -> {path}")
+    print(f"[culling] 그림 {culling['drawn']}  생략 {culling['culled']} ({culling['culled_ratio']:.1%})")
+
+def print_memory_report(rm, top=8):
+    """이미지 캐시(LRU 바이트 예산)의 상주량과 큰 에셋 순 목록을 출력합니다."""
+    r = rm.memory_report()
+    mb = 1024 * 1024
+    print(f"[images] 상주 {r['resident_bytes'] / mb:.1f} MB / 예산 {r['budget_bytes'] / mb:.1f} MB, {len(r['assets'])}개")
+    for a in r["assets"][:top]:
+        print(f"  {a['key']:<40} {a['bytes'] / mb:7.2f} MB  참조 {a['refs']}")
+
+def main(argv=None):
+    args = parse_args(argv)
+    prof = StartupProfiler()
+
+    # 모듈 로드 (게임 로직 모듈은 screens.GameScreen에서 지연 로드)
+    with prof.phase("import", "pygame"):
+        import pygame
+    with prof.phase("import", "config/core"):
+        from config import (WIDTH, HEIGHT, FPS, ASSET_MANIFEST, SFX_PRELOAD, BGM_PRELOAD,
+                            STARTUP_BUDGET_MS, FRAME_PACING, FRAME_LOG, LOG_DIR)
+        from core import ResourceManager, ScreenManager, AudioManager, AssetPreloader
+        from pacing import FramePacer, FrameHistogram
+    with prof.phase("import", "screens"):
+        from screens import LoadingScreen
+    prof.budget_ms = args.startup_budget if args.startup_budget is not None else STARTUP_BUDGET_MS
+
+    # Pygame 초기화 (pygame.init() 대신 필요한 서브시스템만: 조이스틱 등은 초기화하지 않음)
+    with prof.phase("init", "display"):
+        pygame.display.init()
+    with prof.phase("init", "font"):
+        pygame.font.init()
+    with prof.phase("init", "mixer"):
+        try:
+            pygame.mixer.init() # 오디오 믹서 초기화
+        except pygame.error as e:
+            print(f"오디오 장치 초기화 실패 (소리 없이 실행): {e}")
     
     # 화면 설정
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("MAGIC SURVIVOR")
-    clock = pygame.time.Clock()
-    
-    # 매니저 초기화
-    rm = ResourceManager()
-    mgr = ScreenManager()
+    pacer = FramePacer(args.pacing or FRAME_PACING, FPS)
+    frame_times = FrameHistogram(FPS)
+    with prof.phase("init", "set_mode"):
+        screen = pacer.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("MAGIC SURVIVOR")
     
-    # AudioManager 인스턴스 생성
-    # core.py에서 play(), pause() 등의 하위 호환 메서드를 추가했으므로 
-    # 기존 screens.py 코드 변경 없이 작동합니다.
-    audio = AudioManager() 
+    with prof.phase("assets", "managers"):
+        # 매니저 초기화
+        rm = ResourceManager()
+        mgr = ScreenManager()
+        if args.sim_thread: mgr.sim_thread = True
+        if args.render_scale is not None: mgr.render_scale = args.render_scale
+        
+        # AudioManager 인스턴스 생성
+        # core.py에서 play(), pause() 등의 하위 호환 메서드를 추가했으므로 
+        # 기존 screens.py 코드 변경 없이 작동합니다.
+        audio = AudioManager() 
+    with prof.phase("assets", "audio preload start"):
+        # 효과음은 첫 재생 순간(예: 중간 보스 등장)에 디코드하지 않도록 미리 로드
+        audio.preload_sfx(SFX_PRELOAD)
+        for track in BGM_PRELOAD: audio.prepare_bgm(track)
     
-    # 시작 화면 설정 (오디오 매니저 전달)
-    mgr.set(StartScreen(mgr, rm, audio))
+    with prof.phase("assets", "image preload start"):
+        # 이미지 디코드는 워커 스레드에서 진행하고, 그동안 로딩 화면을 표시
+        # (완료되면 LoadingScreen이 시작 화면으로 전환)
+        preloader = AssetPreloader(rm, ASSET_MANIFEST).start()
+        mgr.set(LoadingScreen(mgr, rm, audio, preloader))
     
     # 메인 게임 루프
     while True:
-        dt = clock.tick(FPS) / 1000.0
+        dt = pacer.wait()
+        # 첫 프레임 간격은 시작 시간이라 제외하고, 플레이어가 본 프레임 간격만 기록
+        if prof.first_frame_ms is not None: frame_times.record(dt)
         
         # 이벤트 처리
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if args.profile_gc: print(mgr.gc.report())
+                if args.profile_memory: print_memory_report(rm)
+                if FRAME_LOG: write_frame_log(frame_times, pacer, mgr.culler, LOG_DIR)
+                mgr.close()
                 pygame.quit()
                 sys.exit()
             mgr.handle_event(event)
             
         # 업데이트 및 그리기
         mgr.update(dt)
+        audio.update()
         mgr.draw(screen)
         
-        pygame.display.flip()
+        pacer.flip()
+        # 직전 프레임의 실제 작업 시간(대기와 flip 제외)으로 그래픽 품질 단계 조절
+        mgr.quality.sample(pacer.raw_ms, dt)
+
+        if prof.first_frame_ms is None:
+            prof.mark_first_frame()
+            if args.profile_startup or args.check_startup:
+                print(prof.report())
+                print_memory_report(rm)
+            if prof.over_budget(): print(f"[startup] 시작 시간 예산 초과: {prof.first_frame_ms:.1f} ms > {prof.budget_ms:.0f} ms")
+            if args.check_startup:
+                pygame.quit()
+                sys.exit(1 if prof.over_budget() else 0)
+        elif preloader.done and not any(name == "assets ready" for name, _ in prof.marks):
+            prof.mark("assets ready")
+            if args.profile_startup:
+                print(f"[startup] 에셋 프리로드 완료: {prof.marks[-1][1]:.1f} ms")
+                print_memory_report(rm)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
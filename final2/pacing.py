@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import warnings
+import pygame
+from config import FPS, PACING_SPIN_MS, FRAME_MISS_RATIO
+
+PACING_STRATEGIES = ("tick", "busy", "vsync", "hybrid")
+
+class FramePacer:
+    """프레임 간격을 맞추는 방식을 고를 수 있는 대기 함수 (clock.tick 대체).
+
+    tick: clock.tick (OS sleep, 해상도가 거칠어 간격이 들쭉날쭉할 수 있음)
+    busy: clock.tick_busy_loop (정확하지만 대기 내내 CPU 사용)
+    vsync: display.set_mode(vsync=1)로 flip이 화면 주사율에 맞춰 대기, tick은 측정만
+    hybrid: 목표 시각 PACING_SPIN_MS 전까지 sleep 후 남은 시간만 perf_counter로 대기
+    """
+    def __init__(self, strategy="tick", fps=FPS):
+        if strategy not in PACING_STRATEGIES: raise ValueError(f"알 수 없는 프레임 대기 방식: {strategy}")
+        self.strategy = strategy
+        self.fps = fps
+        self.period = 1.0 / fps
+        self.clock = pygame.time.Clock()
+        self.raw_ms = 0.0          # 직전 프레임의 실제 작업 시간 (대기와 flip 제외)
+        self.last = time.perf_counter()
+        self.next_t = self.last + self.period
+        self.work_start = self.last
+
+    def set_mode(self, size):
+        """화면 생성: vsync 방식이면 vsync를 요청하고, 지원되지 않으면 hybrid로 바꿉니다."""
+        if self.strategy == "vsync":
+            # pygame 2에서 vsync는 SCALED(또는 OPENGL) 렌더러에서만 동작하며,
+            # 하드웨어 렌더러가 없으면 경고만 내고 vsync 없이 만들어지므로 경고도 실패로 취급
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except (pygame.error, Warning) as e:
+                print(f"vsync 사용 불가 (hybrid로 대체): {e}")
+                self.strategy = "hybrid"
+        return pygame.display.set_mode(size)
+
+    def wait(self):
+        """다음 프레임까지 대기하고 직전 프레임부터의 경과 시간(초)을 반환합니다."""
+        if self.strategy == "hybrid": dt = self._wait_hybrid()
+        elif self.strategy == "busy": dt = self.clock.tick_busy_loop(self.fps) / 1000.0
+        elif self.strategy == "vsync": dt = self.clock.tick() / 1000.0
+        else: dt = self.clock.tick(self.fps) / 1000.0
+        self.work_start = time.perf_counter()
+        return dt
+
+    def flip(self):
+        """작업 시간을 기록한 뒤 화면을 갱신합니다.
+
+        vsync에서는 flip이 화면 갱신까지 블로킹하므로 clock.get_rawtime()은 항상 프레임 간격 전체가 됨.
+        그래서 wait() 이후 flip 직전까지를 직접 재서 raw_ms로 씁니다 (모든 방식 공통).
+        """
+        self.raw_ms = (time.perf_counter() - self.work_start) * 1000.0
+        pygame.display.flip()
+
+    def _wait_hybrid(self):
+        start = time.perf_counter()
+        sleep = self.next_t - start - PACING_SPIN_MS / 1000.0
+        if sleep > 0: time.sleep(sleep)
+        while time.perf_counter() < self.next_t: pass
+        now = time.perf_counter()
+        # 한 프레임 이상 밀렸으면 따라잡지 않고 현재 시각부터 다시 맞춤
+        self.next_t = self.next_t + self.period if now - self.next_t < self.period else now + self.period
+        dt, self.last = now - self.last, now
+        return dt
+
+class FrameHistogram:
+    """HDR 방식(로그 구간 x 선형 하위 구간) 프레임 시간 히스토그램.
+
+    값은 마이크로초 단위로 기록하며, 하위 구간 2^SUB_BITS개로 나눠 전 범위에서 상대 오차를 0.4% 안쪽으로
+    유지합니다. 구간 배열 크기가 고정이라 기록 비용은 프레임마다 덧셈 한 번입니다.
+    """
+    SUB_BITS = 8
+    MAX_US = 10_000_000  # 10초 이상은 마지막 구간에 합산
+
+    def __init__(self, fps=FPS, miss_ratio=FRAME_MISS_RATIO):
+        self.budget_ms = 1000.0 / fps
+        self.miss_ratio = miss_ratio
+        self.counts = [0] * self._index(self.MAX_US) + [0]
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.missed = 0          # 예산의 miss_ratio배를 넘긴 프레임 수
+        self.missed_slots = 0    # 그 프레임들이 건너뛴 화면 갱신 횟수 합
+
+    @classmethod
+    def _index(cls, us):
+        shift = max(0, us.bit_length() - cls.SUB_BITS)
+        return (shift << cls.SUB_BITS) + (us >> shift)
+
+    @classmethod
+    def _value_ms(cls, index):
+        """구간의 대표값(구간 중앙, ms)."""
+        shift, sub = divmod(index, 1 << cls.SUB_BITS)
+        return ((sub << shift) + ((1 << shift) - 1) / 2) / 1000.0
+
+    def record(self, dt):
+        ms = dt * 1000.0
+        self.counts[self._index(min(self.MAX_US, int(ms * 1000)))] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if ms > self.budget_ms * self.miss_ratio:
+            self.missed += 1
+            self.missed_slots += max(1, round(ms / self.budget_ms) - 1)
+
+    def percentile(self, p):
+        if self.total == 0: return 0.0
+        target = max(1, round(self.total * p / 100.0))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target: return self._value_ms(i)
+        return self.max_ms
+
+    def summary(self):
+        return {
+            "frames": self.total, "budget_ms": round(self.budget_ms, 3),
+            "mean_ms": round(self.sum_ms / self.total, 3) if self.total else 0.0,
+            "p50_ms": round(self.percentile(50), 3), "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3), "max_ms": round(self.max_ms, 3),
+            "missed_frames": self.missed, "missed_refreshes": self.missed_slots,
+        }
+
+    def write(self, path, **meta):
+        """요약과 비어 있지 않은 구간([대표값 ms, 프레임 수])을 JSON으로 저장합니다."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = dict(meta, **self.summary())
+        data["buckets"] = [[round(self._value_ms(i), 3), n] for i, n in enumerate(self.counts) if n]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        return data
@@ -0,0 +1,109 @@
+import copy
+import numpy as np
+import pygame
+from config import PARTICLE_CAPACITY, PARTICLE_DRAG
+
+# 팔레트 이름별 색상 목록 (방출 시 팔레트 안에서 무작위 선택)
+PALETTES = {
+    "fire": ((255, 69, 0), (255, 140, 30), (255, 200, 50), (255, 240, 150)),
+    "death": ((235, 80, 80), (180, 40, 40), (250, 150, 150)),
+    "boss": ((190, 110, 255), (255, 220, 80), (255, 255, 255)),
+}
+# 수명이 줄어들수록 작아지는 단계별 반지름 (투명도 대신 크기로 소멸 표현)
+PARTICLE_RADII = (3, 2, 1)
+
+class ParticleSystem:
+    """파티클을 고정 크기 NumPy 배열(위치, 속도, 수명, 색상 번호)로 관리합니다.
+
+    살아있는 파티클은 항상 배열 앞쪽 [0:count]에 모여 있으며, 이동/감속/수명 감소는
+    한 번의 벡터 연산으로 처리합니다. 그리기는 (색상 x 크기 단계)별로 미리 그려 둔
+    작은 스프라이트를 blits 한 번으로 출력합니다.
+    """
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.count = 0
+        # 게임 로직의 random 흐름에 영향을 주지 않도록 별도 난수 생성기 사용
+        self.rng = np.random.default_rng()
+
+        self.colors = []
+        self.palette_ids = {}
+        for name, colors in PALETTES.items():
+            start = len(self.colors)
+            self.colors.extend(colors)
+            self.palette_ids[name] = np.arange(start, len(self.colors), dtype=np.int16)
+        self.sprites = None
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, count, palette, speed=(60, 260), life=(0.25, 0.6)):
+        """(x, y)에서 count개를 모든 방향으로 방출합니다. 배열이 가득 차면 남는 만큼만 방출합니다."""
+        i = self.count
+        count = min(count, self.capacity - i)
+        if count <= 0: return
+        j = i + count
+        rng = self.rng
+        ang = rng.uniform(0.0, 2 * np.pi, count)
+        spd = rng.uniform(speed[0], speed[1], count)
+        self.pos[i:j, 0] = x
+        self.pos[i:j, 1] = y
+        self.vel[i:j, 0] = np.cos(ang) * spd
+        self.vel[i:j, 1] = np.sin(ang) * spd
+        self.life[i:j] = self.max_life[i:j] = rng.uniform(life[0], life[1], count)
+        self.color[i:j] = rng.choice(self.palette_ids[palette], count)
+        self.count = j
+
+    def update(self, dt):
+        n = self.count
+        if n == 0: return
+        self.life[:n] -= dt
+        alive = self.life[:n] > 0
+        if not alive.all():
+            k = int(alive.sum())
+            for arr in (self.pos, self.vel, self.life, self.max_life, self.color):
+                arr[:k] = arr[:n][alive]
+            n = self.count = k
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n] *= np.float32(np.exp(-PARTICLE_DRAG * dt))
+
+    def snapshot(self):
+        """그리기용 사본: 살아있는 파티클의 위치/수명/색상만 복사하고 스프라이트는 공유합니다."""
+        v = copy.copy(self)
+        n = self.count
+        v.pos, v.life, v.max_life, v.color = (self.pos[:n].copy(), self.life[:n].copy(),
+                                              self.max_life[:n].copy(), self.color[:n].copy())
+        return v
+
+    def prepare_draw(self):
+        if self.sprites is None: self._build_sprites()
+
+    def _build_sprites(self):
+        self.sprites = []
+        for color in self.colors:
+            for r in PARTICLE_RADII:
+                s = pygame.Surface((r * 2, r * 2))
+                if pygame.display.get_surface(): s = s.convert()
+                s.fill((0, 0, 0))
+                pygame.draw.circle(s, color, (r, r), r)
+                s.set_colorkey((0, 0, 0))
+                self.sprites.append(s)
+
+    def draw(self, surf, view, limit=None):
+        """살아있는 파티클을 그립니다. limit이 주어지면 가장 최근에 방출된 limit개만 그립니다."""
+        n = self.count
+        if n == 0: return
+        self.prepare_draw()
+        lo = max(0, n - limit) if limit else 0
+        steps = len(PARTICLE_RADII)
+        age = 1.0 - self.life[lo:n] / self.max_life[lo:n]
+        idx = self.color[lo:n].astype(np.int32) * steps + np.minimum((age * steps).astype(np.int32), steps - 1)
+        sprites = [view.sprite(s) for s in self.sprites]
+        half = np.array([s.get_width() // 2 for s in sprites], dtype=np.int32)[idx]
+        xs = ((self.pos[lo:n, 0] - view.x) * view.scale).astype(np.int32) - half
+        ys = ((self.pos[lo:n, 1] - view.y) * view.scale).astype(np.int32) - half
+        surf.blits([(sprites[t], (x, y)) for t, x, y in zip(idx.tolist(), xs.tolist(), ys.tolist())], False)
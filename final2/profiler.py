@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """실행 시작부터 첫 프레임까지를 import / init / assets 구간별로 기록합니다."""
+    def __init__(self, budget_ms=None):
+        self.t0 = time.perf_counter()
+        self.budget_ms = budget_ms
+        self.phases = []   # (구분, 이름, 소요 ms)
+        self.marks = []    # (이름, 시작 기준 경과 ms)
+        self.first_frame_ms = None
+
+    def now_ms(self):
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    @contextmanager
+    def phase(self, category, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((category, name, (time.perf_counter() - start) * 1000.0))
+
+    def mark(self, name):
+        self.marks.append((name, self.now_ms()))
+
+    def mark_first_frame(self):
+        if self.first_frame_ms is None:
+            self.first_frame_ms = self.now_ms()
+
+    def over_budget(self):
+        return (self.budget_ms is not None and self.first_frame_ms is not None
+                and self.first_frame_ms > self.budget_ms)
+
+    def report(self):
+        lines = ["[startup] 구간별 시간"]
+        totals = {}
+        for category, name, ms in self.phases:
+            totals[category] = totals.get(category, 0.0) + ms
+            lines.append(f"  {category:<7} {name:<28} {ms:8.1f} ms")
+        for category, ms in totals.items():
+            lines.append(f"  = {category:<34} {ms:8.1f} ms")
+        for name, ms in self.marks:
+            lines.append(f"  @ {name:<34} {ms:8.1f} ms")
+        if self.first_frame_ms is not None:
+            budget = f" (예산 {self.budget_ms:.0f} ms)" if self.budget_ms is not None else ""
+            lines.append(f"  첫 프레임까지 {self.first_frame_ms:.1f} ms{budget}")
+        return "\n".join(lines)
@@ -0,0 +1,55 @@
+import heapq
+import itertools
+
+class ScheduledEvent:
+    __slots__ = ("time", "seq", "callback", "cancelled")
+
+    def __init__(self, time, seq, callback):
+        self.time = time
+        self.seq = seq
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.time, self.seq) < (other.time, other.seq)
+
+class EventScheduler:
+    """시뮬레이션 시간 기준 이벤트 스케줄러 (최소 힙).
+
+    스킬 쿨다운, 보스 등장, 제한 시간, 효과 만료처럼 '언젠가 한 번 일어나는 일'을
+    등록해 두면 advance()에서 시간이 된 이벤트만 꺼내 실행합니다. 틱당 비용은
+    등록된 타이머 수가 아니라 그 틱에 만기된 이벤트 수에 비례합니다.
+    취소는 표시만 해 두고 꺼낼 때 건너뜁니다.
+    """
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = itertools.count()
+
+    def clear(self):
+        self.now = 0.0
+        self._heap = []
+
+    def schedule_at(self, time, callback):
+        """callback(*advance_args)를 시뮬레이션 시각 time에 실행하도록 등록합니다."""
+        ev = ScheduledEvent(time, next(self._seq), callback)
+        heapq.heappush(self._heap, ev)
+        return ev
+
+    def schedule(self, delay, callback):
+        return self.schedule_at(self.now + delay, callback)
+
+    def cancel(self, ev):
+        if ev is not None: ev.cancelled = True
+
+    def advance(self, dt, *args):
+        """시간을 dt만큼 진행하고 만기된 이벤트를 시각 순서대로 실행합니다."""
+        self.now += dt
+        heap = self._heap
+        while heap and heap[0].time <= self.now:
+            ev = heapq.heappop(heap)
+            if not ev.cancelled:
+                ev.callback(*args)
+
+    def __len__(self):
+        return sum(1 for ev in self._heap if not ev.cancelled)
@@ -1,16 +1,13 @@
 import pygame
 import random
 import math
-import sys
 import os
+import contextlib
 from config import (WIDTH, HEIGHT, BLACK, WHITE, BLUE, RED, GREEN, 
-                    MAX_SKILL_LEVEL, BGM_START, BGM_GAME, BGM_CLEAR)
-from entities import Player, Enemy
-# skill.py의 스킬 시스템 임포트
-from skill import BaseShotSkill, FireConeSkill, ElectricShockSkill, ShieldSkill
-
-# 외부 파일에서 로직 컨트롤러와 웨이브 매니저를 가져옵니다.
-from game_controller import WaveManager, GameController
+                    MAX_SKILL_LEVEL, BGM_START, BGM_GAME, BGM_CLEAR, BGM_FADE_MS, PLAYER_PRESETS)
+from core import RenderScaler
+from sim_thread import RenderSnapshot, SimulationThread
+# ✅ skill.py / game_controller.py는 시작 메뉴에 필요 없으므로 GameScreen 생성 시점에 임포트합니다.
 
 # -----------------------------
 # 1. UI Helpers & Constants
@@ -60,6 +57,9 @@ class HealSkill:
         self.max_level = MAX_SKILL_LEVEL # 최대 사용 횟수 제한 (예: 5회)
         self.player = None  # GameScreen에서 설정됨
 
+    def reset(self, level):
+        self.level = level
+
     def apply_upgrade(self):
         self.level += 1
         if self.player:
@@ -264,24 +264,66 @@ class SkillChoiceOverlay:
 # -----------------------------
 # 3. Main Screens
 # -----------------------------
-class StartScreen:
+class AssetOwner:
+    """화면이 쓰는 이미지를 핸들로 고정하고, 화면을 떠날 때(ScreenManager.set) 한 번에 해제합니다."""
+    def __init__(self):
+        self.handles = []
+
+    def acquire(self, name, size):
+        handle = self.rm.acquire_image(name, size)
+        self.handles.append(handle)
+        return handle.surface
+
+    def release_assets(self):
+        for h in self.handles: h.release()
+        self.handles = []
+
+    def exit(self):
+        """화면을 떠날 때 (ScreenManager.set) 호출: 고정해 둔 이미지를 해제합니다. 다시 들어오면 enter에서 다시 고정."""
+        self.release_assets()
+
+class LoadingScreen:
+    """에셋 프리로더가 끝날 때까지 진행률을 보여주고, 완료되면 시작 화면으로 넘어갑니다."""
+    def __init__(self, mgr, rm, audio, preloader):
+        self.mgr = mgr; self.rm = rm; self.audio = audio
+        self.preloader = preloader
+        self.font_h2 = pygame.font.SysFont("malgungothic", 26, bold=True)
+        self.font_small = pygame.font.SysFont("malgungothic", 16)
+
+    def handle_event(self, event): pass
+
+    def update(self, dt):
+        if self.preloader.pump():
+            # 시작 시 만든 객체(에셋, 폰트, 모듈)는 이후 GC 검사 대상에서 제외
+            self.mgr.gc.freeze()
+            self.mgr.show(StartScreen, self.rm, self.audio)
+
+    def draw(self, surf):
+        surf.fill((18, 18, 24))
+        title = self.font_h2.render("MAGIC SURVIVOR", True, WHITE)
+        surf.blit(title, title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50)))
+
+        bar = pygame.Rect(WIDTH // 2 - 260, HEIGHT // 2, 520, 22)
+        pygame.draw.rect(surf, (45, 45, 55), bar, border_radius=10)
+        pygame.draw.rect(surf, BLUE, (bar.x, bar.y, int(bar.w * self.preloader.progress), bar.h), border_radius=10)
+        pygame.draw.rect(surf, (170, 170, 185), bar, 2, border_radius=10)
+
+        p = self.preloader
+        tip = self.font_small.render(f"리소스 불러오는 중... {p.loaded}/{p.total}", True, (210, 210, 220))
+        surf.blit(tip, tip.get_rect(center=(WIDTH // 2, bar.bottom + 24)))
+
+class StartScreen(AssetOwner):
     def __init__(self, mgr, rm, audio):
+        super().__init__()
         self.mgr = mgr; self.rm = rm; self.audio = audio
-        self.audio.play(BGM_START)
-        
-        # 배경 이미지 로드
-        self.bg = self.rm.get_image("game_background.png", (WIDTH, HEIGHT))
+        self.bg = None  # 배경/카드 이미지는 화면에 들어올 때(enter) 고정
         
         # 폰트
         self.font_h1 = pygame.font.SysFont("malgungothic", 64, bold=True)
         self.font_h2 = pygame.font.SysFont("malgungothic", 26, bold=True)
 
         # 플레이어 설정 데이터
-        self.PLAYERS = [
-            {"id": "tank", "name": "플레이어 1", "HP": 150, "VEL": 240, "DMG": 1.0, "img_file": "player_1.png"},
-            {"id": "speed", "name": "플레이어 2", "HP": 100, "VEL": 360, "DMG": 1.0, "img_file": "player_2.png"},
-            {"id": "damage", "name": "플레이어 3", "HP": 100, "VEL": 240, "DMG": 1.5, "img_file": "player_3.png"}
-        ]
+        self.PLAYERS = PLAYER_PRESETS
         
         # 카드 레이아웃
         self.card_w, self.card_h = 250, 410
@@ -294,8 +336,7 @@ class StartScreen:
         self.cards = []
         for i, p_data in enumerate(self.PLAYERS):
             rect = pygame.Rect(self.start_x + i * (self.card_w + self.gap), self.y_cards, self.card_w, self.card_h)
-            img = self.rm.get_image(p_data["img_file"], (150, 150)) # 카드 내부용 이미지 사이즈
-            self.cards.append(PlayerCard(rect, p_data, img))
+            self.cards.append(PlayerCard(rect, p_data, None))
         self.selected_idx = 0
 
         # 난이도(스테이지) 패널
@@ -317,13 +358,20 @@ class StartScreen:
         
         self._sync()
 
+    def enter(self):
+        self.audio.play(BGM_START)
+        # 배경 이미지 로드
+        self.bg = self.acquire("game_background.png", (WIDTH, HEIGHT))
+        for card in self.cards:
+            card.image = self.acquire(card.data["img_file"], (150, 150)) # 카드 내부용 이미지 사이즈
+
     def _sync(self):
         for i, c in enumerate(self.cards): c.selected = (i == self.selected_idx)
         for i, s in enumerate(self.stage_cards): s.selected = (i == self.stage_idx)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE: pygame.quit(); sys.exit()
+            if event.key == pygame.K_ESCAPE: self._quit()
             if event.key == pygame.K_RETURN: self._start_game()
             
             # 숫자키로 선택
@@ -340,15 +388,19 @@ class StartScreen:
                 if sc.rect.collidepoint(event.pos): self.stage_idx = i
             self._sync()
             
-        if self.btn_exit.clicked(event): pygame.quit(); sys.exit()
+        if self.btn_exit.clicked(event): self._quit()
         if self.btn_start.clicked(event): self._start_game()
 
+    def _quit(self):
+        # 창 닫기와 같은 종료 경로(main의 QUIT 처리: 프레임 기록/GC 보고/화면 정리)를 타도록 이벤트로 요청
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
     def _start_game(self):
         # 선택된 플레이어 및 난이도 설정
         cfg = dict(self.PLAYERS[self.selected_idx])
         cfg["IMG"] = self.PLAYERS[self.selected_idx]["img_file"]
         cfg["DIFFICULTY"] = self.stage_cards[self.stage_idx].key
-        self.mgr.set(GameScreen(self.mgr, cfg, self.rm, self.audio))
+        self.mgr.show(GameScreen, self.rm, self.audio, cfg)
 
     def update(self, dt): pass
 
@@ -377,24 +429,18 @@ class StartScreen:
         self.btn_exit.draw(surf, mouse)
         self.btn_start.draw(surf, mouse)
 
-class GameScreen:
-    def __init__(self, mgr, player_config, rm, audio):
+class GameScreen(AssetOwner):
+    gameplay = True  # ScreenManager가 이 화면에서는 GC 임계값을 높임
+
+    def __init__(self, mgr, rm, audio):
+        # 게임 로직 모듈은 처음 게임을 시작할 때 로드 (시작 메뉴까지의 로딩 시간 단축)
+        from skill import BaseShotSkill, FireConeSkill, ElectricShockSkill, ShieldSkill
+        super().__init__()
         self.mgr = mgr; self.rm = rm; self.audio = audio
-        self.controller = GameController(rm, player_config)
-        self.audio.play(BGM_GAME)
-        self._load_resources(player_config)
+        self.controller = None  # 첫 reset에서 생성, 이후 판에서는 저장소를 재사용
         
         # ✅ 스킬 초기화 (HealSkill 포함)
         self.skills = [BaseShotSkill(), FireConeSkill(), ElectricShockSkill(), ShieldSkill(), HealSkill()]
-        
-        # 1레벨부터 시작하는 기본 스킬(BaseShotSkill) 제외하고 나머지는 0레벨
-        for i in range(1, len(self.skills)):
-            self.skills[i].level = 0
-
-        # ✅ 모든 스킬에 플레이어 참조 주입 (HealSkill 회복 효과를 위해 필수)
-        for s in self.skills:
-            s.player = self.controller.player
-        
         self.overlay = None; self.paused = False; self.pause_overlay = None
         
         # UI Font
@@ -406,40 +452,99 @@ class GameScreen:
         self.btn_pause = Button((WIDTH - 150, 14, 130, 40), "Pause (P)", (90, 90, 110), (120, 120, 140), font=pygame.font.SysFont("malgungothic", 22), radius=14)
         
         self.cam = pygame.Vector2(0, 0) 
+        # 화면 밖 엔티티는 그리지 않도록 카메라 기준 컬링 (카운터는 세션 전체로 집계되도록 ScreenManager가 소유)
+        self.culler = self.mgr.culler
+        # 게임 월드를 그릴 내부 해상도 (HUD/오버레이는 화면 해상도 그대로)
+        self.view = RenderScaler(self.mgr.render_scale)
+        self.sim = None  # 시뮬레이션 스레드 (스레드 모드에서 enter마다 새로 시작)
+
+    def reset(self, player_config):
+        """새 판 준비: 화면 객체(글꼴/버튼/스킬)와 컨트롤러 저장소는 재사용하고 상태만 처음으로 되돌립니다."""
+        from game_controller import GameController
+        if self.controller is None: self.controller = GameController(self.rm, player_config)
+        else: self.controller.reset(player_config)
+
+        for i, s in enumerate(self.skills):
+            # 1레벨부터 시작하는 기본 스킬(BaseShotSkill) 제외하고 나머지는 0레벨
+            s.reset(1 if i == 0 else 0)
+            # ✅ 모든 스킬에 플레이어 참조 주입 (HealSkill 회복 효과를 위해 필수)
+            s.player = self.controller.player
+            # 쿨다운은 컨트롤러의 이벤트 스케줄러에 등록 (HealSkill은 즉시 발동형이라 제외)
+            if hasattr(s, "bind"): s.bind(self.controller.scheduler)
+
+        self.overlay = None; self.paused = False; self.pause_overlay = None
+
+    def enter(self):
+        self.audio.play(BGM_GAME)
+        self._load_resources(self.controller.player_config)
+
+        # 시뮬레이션 스레드 모드: 게임 로직은 별도 스레드에서 돌고 화면은 최신 스냅샷을 그림
+        if self.mgr.sim_thread:
+            # 스냅샷 사본이 공유할 스프라이트/글꼴은 메인 스레드에서 미리 생성
+            c = self.controller
+            c.orbs.prepare_draw(); c.particles.prepare_draw(); c.damage_numbers.prepare_draw()
+            self.sim = SimulationThread(self)
+            # 첫 틱이 시뮬레이션 스레드에서 pygame.key.get_pressed()를 호출하지 않도록 키 상태를 먼저 기록
+            self.sim.keys = pygame.key.get_pressed()
+            self.sim.start()
 
     def _load_resources(self, cfg):
-        self.bg = self.rm.get_image("game_background.png", (WIDTH, HEIGHT))
-        self.player_img = self.rm.get_image(cfg.get("IMG", ""), (80, 80))
-        self.img_spider = self.rm.get_image("monster_spider.png", (30, 30))
-        self.img_skull = self.rm.get_image("monster_bone.png", (30, 30))
-        self.img_midboss = self.rm.get_image("middle_boss_dimenter.png", (120, 120))
-        self.img_finalboss = self.rm.get_image("final_boss_pumpkin.png", (150, 150))
+        self.bg = self.acquire("game_background.png", (WIDTH, HEIGHT))
+        self.player_img = self.acquire(cfg.get("IMG", ""), (80, 80))
+        self.img_spider = self.acquire("monster_spider.png", (30, 30))
+        self.img_skull = self.acquire("monster_bone.png", (30, 30))
+        self.img_midboss = self.acquire("middle_boss_dimenter.png", (120, 120))
+        self.img_finalboss = self.acquire("final_boss_pumpkin.png", (150, 150))
 
     def trigger_level_up(self):
         if any(s.level < MAX_SKILL_LEVEL for s in self.skills):
             self.overlay = SkillChoiceOverlay(self); self.audio.pause()
+            self.mgr.gc.collect("레벨업")  # 선택을 기다리는 동안이라 멈춤이 보이지 않음
 
     def finish_game(self, success, reason):
-        # 보스 브금 등을 끄고 결과 화면으로 전환
-        self.audio.stop()
+        # 보스 브금 등을 페이드아웃하며 결과 화면으로 전환
+        self.audio.stop(BGM_FADE_MS)
         stats = {
             "survival_time": self.controller.wave_mgr.elapsed, 
             "kill_count": self.controller.player.kills, 
             "player_config": self.controller.player_config, 
             "reason": reason
         }
-        self.mgr.set(EndScreen(self.mgr, success, stats, self.rm, self.audio))
+        self.mgr.show(EndScreen, self.rm, self.audio, success, stats)
 
     def _toggle_pause(self):
         self.paused = not self.paused
         if self.paused:
             self.audio.pause()
             self.pause_overlay = PauseOverlay(self)
+            self.mgr.gc.collect("일시정지")
         else:
             self.audio.unpause()
             self.pause_overlay = None
 
+    def exit(self):
+        # 스레드는 다시 시작할 수 없으므로 종료 표시 후 버리고, 다음 enter에서 새로 만듦
+        if self.sim:
+            self.sim.stop()
+            self.sim = None
+        # 화면 객체는 풀에 남으므로 축소 스프라이트 캐시가 해제된 원본 이미지를 붙잡지 않게 비움
+        self.view.clear()
+        super().exit()
+
+    def close(self):
+        """프로그램 종료 시 (ScreenManager.close): lock 밖에서 호출되므로 진행 중인 틱이 끝날 때까지 기다린 뒤 퇴장."""
+        if self.sim: self.sim.stop(join=True)
+        self.exit()
+
+    def _sim_lock(self):
+        # 스레드 모드에서는 게임 상태를 바꾸는 동안 시뮬레이션 틱이 끼어들지 않도록 잠금
+        return self.sim.lock if self.sim else contextlib.nullcontext()
+
     def handle_event(self, event):
+        with self._sim_lock():
+            self._handle_event(event)
+
+    def _handle_event(self, event):
         if self.overlay and self.overlay.active:
             self.overlay.handle_event(event)
             if not self.overlay.active: self.overlay = None
@@ -452,62 +557,104 @@ class GameScreen:
             return
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p: self._toggle_pause()
-            if event.key == pygame.K_ESCAPE: self.audio.stop(); self.mgr.set(StartScreen(self.mgr, self.rm, self.audio))
-        if self.btn_to_start.clicked(event): self.audio.stop(); self.mgr.set(StartScreen(self.mgr, self.rm, self.audio))
+            if event.key == pygame.K_ESCAPE: self.audio.stop(BGM_FADE_MS); self.mgr.show(StartScreen, self.rm, self.audio)
+        if self.btn_to_start.clicked(event): self.audio.stop(BGM_FADE_MS); self.mgr.show(StartScreen, self.rm, self.audio)
         if self.btn_pause.clicked(event): self._toggle_pause()
 
+    def can_simulate(self):
+        return not self.paused and self.overlay is None
+
+    def step(self, dt, ctx, keys=None):
+        """게임 로직 한 틱 (ctx: 단일 스레드에서는 self, 스레드 모드에서는 SimContext)"""
+        c = self.controller
+        c.tick_logic(dt, ctx, keys)
+        if c.player.hp <= 0: ctx.finish_game(False, "플레이어 HP 소진")
+        if c.wave_mgr.elapsed >= c.wave_mgr.total_time: ctx.finish_game(False, "시간 종료")
+
     def update(self, dt):
-        if not self.paused and self.overlay is None:
-            self.controller.tick_logic(dt, self)
-            if self.controller.player.hp <= 0: self.finish_game(False, "플레이어 HP 소진")
-            if self.controller.wave_mgr.elapsed >= self.controller.wave_mgr.total_time: self.finish_game(False, "시간 종료")
+        if self.sim is None:
+            if self.can_simulate(): self.step(dt, self)
+            return
+        # 스레드 모드: 입력 상태를 넘겨주고, 시뮬레이션이 요청한 화면 전환/오디오를 메인 스레드에서 실행
+        with self.sim.lock:
+            self.sim.keys = pygame.key.get_pressed()
+            self.controller.player.aim_pos = pygame.Vector2(pygame.mouse.get_pos())
+            self.sim.drain()
 
     def draw(self, surf):
+        # 게임 월드는 내부 해상도 표면(view.surface)에 그리고, 화면 크기로 늘린 뒤 HUD를 그림
+        screen, view = surf, self.view
+        surf = view.begin(screen, self.cam)
+
         # 1. 배경
-        if self.bg: surf.blit(self.bg, (0, 0))
+        if self.bg: surf.blit(view.sprite(self.bg), (0, 0))
         else: surf.fill(BLACK)
         
         # 2. 플레이 영역 (아레나) 경계선
-        arena = pygame.Rect(20, 70, WIDTH-40, HEIGHT-90)
+        arena = view.rect(20, 70, WIDTH-40, HEIGHT-90)
         # 안쪽은 비우고 테두리만 그리기 (배경이 보이도록)
-        pygame.draw.rect(surf, (70,70,85), arena, 2, border_radius=18)
+        pygame.draw.rect(surf, (70,70,85), arena, view.length(2), border_radius=view.length(18))
+        
+        # 그릴 상태: 스레드 모드에서는 마지막으로 발행된 스냅샷, 아니면 현재 객체를 그대로 참조
+        snap = self.sim.latest if self.sim else RenderSnapshot.capture(self.controller, self.skills)
+        q = self.mgr.quality.tier  # 프레임 시간에 따라 조절되는 그래픽 품질 단계
+        
+        # 경험치 구슬 (적보다 아래 레이어)
+        snap.orbs.draw(surf, view)
         
-        c = self.controller; w = c.wave_mgr
+        # 카메라 영역 안의 엔티티만 조회
+        area = self.culler.begin(self.cam)
+        vis_enemies, vis_projectiles = snap.query_visible(area)
+        self.culler.record(len(vis_enemies) + len(vis_projectiles), len(snap.enemies) + len(snap.projectiles))
         
         # 3. 적 그리기
-        for e in c.enemies:
-            if not e.alive(): continue
-            surf.blit(e.img, e.img.get_rect(center=e.pos))
+        for e in vis_enemies:
+            img = view.sprite(e.img)
+            surf.blit(img, img.get_rect(center=view.point(e.pos.x, e.pos.y)))
             # 보스 체력바
             if e.kind in ("midboss", "finalboss"):
-                bx, by, bw, bh = int(e.pos.x - 100), int(e.pos.y - 70), 200, 12
-                pygame.draw.rect(surf, (45, 45, 55), (bx, by, bw, bh), border_radius=8)
-                pygame.draw.rect(surf, WHITE, (bx, by, int(bw * (e.hp / e.max_hp)), bh), border_radius=8)
-            # 일반 몬스터 체력바 (작게)
-            else:
+                bar = view.rect(int(e.pos.x - 100), int(e.pos.y - 70), 200, 12)
+                radius = view.length(8)
+                pygame.draw.rect(surf, (45, 45, 55), bar, border_radius=radius)
+                bar.width = int(bar.width * (e.hp / e.max_hp))
+                pygame.draw.rect(surf, WHITE, bar, border_radius=radius)
+            # 일반 몬스터 체력바 (작게, 저품질 단계에서는 생략)
+            elif q.minor_hp_bars:
                 bw, bh = 40, 6
-                bx, by = int(e.pos.x - bw // 2), int(e.pos.y + 22)
-                pygame.draw.rect(surf, (45, 45, 55), (bx, by, bw, bh), border_radius=3)
-                pygame.draw.rect(surf, RED, (bx, by, int(bw * (e.hp / e.max_hp)), bh), border_radius=3)
+                bar = view.rect(int(e.pos.x - bw // 2), int(e.pos.y + 22), bw, bh)
+                radius = view.length(3)
+                pygame.draw.rect(surf, (45, 45, 55), bar, border_radius=radius)
+                bar.width = int(bar.width * (e.hp / e.max_hp))
+                pygame.draw.rect(surf, RED, bar, border_radius=radius)
         
         # 4. 스킬 및 투사체
-        for p in c.skill_projectiles: p.draw(surf, self.cam)
-        if self.skills[2].level > 0: self.skills[2].draw(surf, self.cam) # Electric
-        if self.skills[3].level > 0: self.skills[3].draw(surf, c.player, self.cam) # Shield
+        if q.max_effects: vis_projectiles = vis_projectiles[-q.max_effects:]
+        for p in vis_projectiles: p.draw(surf, view, q)
+        if snap.electric: snap.electric.draw(surf, view, q) # Electric
+        if snap.shield: snap.shield.draw(surf, snap.player, view, q) # Shield
+        snap.particles.draw(surf, view, q.max_particles)
         
         # 5. 플레이어
-        surf.blit(self.player_img, self.player_img.get_rect(center=c.player.pos))
+        img = view.sprite(self.player_img)
+        surf.blit(img, img.get_rect(center=view.point(snap.player.pos.x, snap.player.pos.y)))
+        
+        # 여기부터는 화면 해상도로 그림 (글자가 흐려지지 않도록)
+        view.present(screen)
+        surf = screen
+        
+        # 데미지 숫자
+        snap.damage_numbers.draw(surf, self.cam)
         
         # 6. HUD
-        self._draw_hud(surf)
+        self._draw_hud(surf, snap)
         
         # 오버레이
         if self.overlay: self.overlay.draw(surf)
         elif self.paused and self.pause_overlay:
             self.pause_overlay.draw(surf)
 
-    def _draw_hud(self, surf):
-        c = self.controller; w = c.wave_mgr
+    def _draw_hud(self, surf, snap):
+        player = snap.player; w = snap.wave
         
         # 상단 바 배경
         bar_x, bar_y = 30, 18
@@ -515,23 +662,28 @@ class GameScreen:
         pygame.draw.rect(surf, (45, 45, 55), (bar_x, bar_y, bar_w, bar_h), border_radius=10)
         
         # 경험치 바
-        ratio = 0.0 if c.player.exp_need <= 0 else (c.player.exp / c.player.exp_need)
+        ratio = 0.0 if player.exp_need <= 0 else (player.exp / player.exp_need)
         pygame.draw.rect(surf, BLUE, (bar_x, bar_y, int(bar_w * ratio), bar_h), border_radius=10)
         pygame.draw.rect(surf, (170, 170, 185), (bar_x, bar_y, bar_w, bar_h), 2, border_radius=10)
         
         # 텍스트 정보
-        surf.blit(self.font_small.render(f"EXP {c.player.exp}/{c.player.exp_need}", True, WHITE), (bar_x + 10, bar_y - 2))
-        surf.blit(self.font.render(f"레벨 {c.player.level}", True, WHITE), (bar_x + bar_w + 18, 14))
-        surf.blit(self.font.render(f"처치수 {c.player.kills}", True, WHITE), (bar_x + bar_w + 140, 14))
+        surf.blit(self.font_small.render(f"EXP {player.exp}/{player.exp_need}", True, WHITE), (bar_x + 10, bar_y - 2))
+        surf.blit(self.font.render(f"레벨 {player.level}", True, WHITE), (bar_x + bar_w + 18, 14))
+        surf.blit(self.font.render(f"처치수 {player.kills}", True, WHITE), (bar_x + bar_w + 140, 14))
         
         # 시간 표시
         rem = max(0.0, w.total_time - w.elapsed)
         surf.blit(self.font.render(f"{int(rem//60)}:{int(rem%60):02d}", True, WHITE), (WIDTH - 420, 14))
+
+        # 그래픽 품질을 낮춘 경우 현재 단계와 평균 프레임 작업 시간 표시
+        qg = self.mgr.quality
+        if qg.level > 0:
+            surf.blit(self.font_small.render(f"그래픽 {qg.tier.name} ({qg.avg_ms:.1f}ms)", True, (200, 200, 140)), (WIDTH - 290, 60))
         
         # 플레이어 HP 바
-        px, py, pw, ph = int(c.player.pos.x - 80), int(c.player.pos.y + 34), 160, 14
+        px, py, pw, ph = int(player.pos.x - 80), int(player.pos.y + 34), 160, 14
         pygame.draw.rect(surf, (45, 45, 55), (px, py, pw, ph), border_radius=8)
-        pygame.draw.rect(surf, RED, (px, py, int(pw * (c.player.hp / c.player.max_hp)), ph), border_radius=8)
+        pygame.draw.rect(surf, RED, (px, py, int(pw * (player.hp / player.max_hp)), ph), border_radius=8)
         pygame.draw.rect(surf, (180, 180, 195), (px, py, pw, ph), 2, border_radius=8)
         
         # 보스 타이머 배너
@@ -548,15 +700,12 @@ class GameScreen:
         self.btn_to_start.draw(surf, mouse)
         self.btn_pause.draw(surf, mouse)
 
-class EndScreen:
-    def __init__(self, mgr, success, stats, rm, audio):
-        self.mgr = mgr; self.success = success; self.stats = stats; self.rm = rm; self.audio = audio
-        
-        if self.success:
-            self.audio.play_sfx(BGM_CLEAR)
-        
-        # 배경 로드
-        self.bg = self.rm.get_image("game_background.png", (WIDTH, HEIGHT))
+class EndScreen(AssetOwner):
+    def __init__(self, mgr, rm, audio):
+        super().__init__()
+        self.mgr = mgr; self.rm = rm; self.audio = audio
+        self.success = False; self.stats = {}
+        self.bg = None
             
         self.font_h1 = pygame.font.SysFont("malgungothic", 86)
         self.font_h2 = pygame.font.SysFont("malgungothic", 36)
@@ -577,25 +726,36 @@ class EndScreen:
         
         self.panel_rect = pygame.Rect((WIDTH - self.PANEL_W)//2, btn_y - 28 - self.PANEL_H, self.PANEL_W, self.PANEL_H)
 
+    def reset(self, success, stats):
+        self.success = success; self.stats = stats
+
+    def enter(self):
+        if self.success:
+            # 클리어 브금은 효과음처럼 통째로 디코드하지 않고 BGM 스트림으로 한 번 재생
+            self.audio.play_bgm(BGM_CLEAR, 0)
+        
+        # 배경 로드
+        self.bg = self.acquire("game_background.png", (WIDTH, HEIGHT))
+
     def _stop_clear_sound(self):
-        """화면 전환 시 클리어 브금(SFX)이 재생 중이라면 중단합니다."""
-        if self.success and BGM_CLEAR in self.audio.sfx_cache:
-            self.audio.sfx_cache[BGM_CLEAR].stop()
+        """화면 전환 시 클리어 브금이 재생 중이라면 페이드아웃합니다."""
+        if self.success:
+            self.audio.stop(BGM_FADE_MS)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN: 
                 self._stop_clear_sound()
-                self.mgr.set(GameScreen(self.mgr, self.stats["player_config"], self.rm, self.audio))
+                self.mgr.show(GameScreen, self.rm, self.audio, self.stats["player_config"])
             if event.key == pygame.K_ESCAPE: 
                 self._stop_clear_sound()
-                self.mgr.set(StartScreen(self.mgr, self.rm, self.audio))
+                self.mgr.show(StartScreen, self.rm, self.audio)
         if self.btn_restart.clicked(event): 
             self._stop_clear_sound()
-            self.mgr.set(GameScreen(self.mgr, self.stats["player_config"], self.rm, self.audio))
+            self.mgr.show(GameScreen, self.rm, self.audio, self.stats["player_config"])
         if self.btn_to_start.clicked(event): 
             self._stop_clear_sound()
-            self.mgr.set(StartScreen(self.mgr, self.rm, self.audio))
+            self.mgr.show(StartScreen, self.rm, self.audio)
 
     def update(self, dt): pass
     
@@ -0,0 +1,144 @@
+import time
+import threading
+from collections import namedtuple, deque
+import pygame
+from config import SIM_RATE
+
+PlayerView = namedtuple("PlayerView", "pos hp max_hp exp exp_need level kills")
+WaveView = namedtuple("WaveView", "elapsed total_time boss_deadline active_boss_kind")
+EnemyView = namedtuple("EnemyView", "pos img kind hp max_hp")
+
+class RenderSnapshot:
+    """한 틱 시점의 그리기용 상태 (적/투사체/이펙트/HUD 값).
+
+    스레드 모드에서는 시뮬레이션 스레드가 매 틱 복사본(copy_state=True)을 만들어 발행하고,
+    단일 스레드 모드에서는 그리기 직전에 실제 객체를 그대로 참조하는 스냅샷을 만듭니다.
+    """
+    __slots__ = ("player", "wave", "enemies", "projectiles", "orbs", "particles",
+                 "damage_numbers", "electric", "shield")
+
+    @classmethod
+    def capture(cls, controller, skills, copy_state=False):
+        s = cls()
+        p, w = controller.player, controller.wave_mgr
+        s.player = PlayerView(pygame.Vector2(p.pos), p.hp, p.max_hp, p.exp, p.exp_need, p.level, p.kills)
+        s.wave = WaveView(w.elapsed, w.total_time, w.boss_deadline, w.active_boss_kind)
+        electric, shield = skills[2], skills[3]
+        if copy_state:
+            s.enemies = [EnemyView(pygame.Vector2(e.pos), e.img, e.kind, e.hp, e.max_hp)
+                         for e in controller.enemies if e.alive()]
+            s.projectiles = [pr.snapshot() for pr in controller.skill_projectiles]
+            s.orbs = controller.orbs.snapshot()
+            s.particles = controller.particles.snapshot()
+            s.damage_numbers = controller.damage_numbers.snapshot()
+            s.electric = electric.snapshot() if electric.level > 0 else None
+            s.shield = shield.snapshot() if shield.level > 0 else None
+        else:
+            # 틱이 끝난 뒤의 적 목록에는 살아있는 적만 남아 있으므로 사본 없이 그대로 사용
+            s.enemies = controller.enemies
+            s.projectiles = controller.skill_projectiles
+            s.orbs, s.particles, s.damage_numbers = controller.orbs, controller.particles, controller.damage_numbers
+            s.electric = electric if electric.level > 0 else None
+            s.shield = shield if shield.level > 0 else None
+        return s
+
+    def query_visible(self, view):
+        """조회 영역(view)과 겹치는 적과 투사체만 반환합니다."""
+        collide = view.collidepoint
+        return [e for e in self.enemies if collide(e.pos)], [p for p in self.projectiles if collide(p.pos)]
+
+class _DeferredCalls:
+    """대상 객체의 메서드 호출을 큐에 쌓아 두었다가 메인 스레드에서 실행하게 합니다."""
+    def __init__(self, target, queue):
+        self._target = target
+        self._queue = queue
+
+    def __getattr__(self, name):
+        fn = getattr(self._target, name)
+        return lambda *args: self._queue.append((fn, args))
+
+class SimContext:
+    """시뮬레이션 스레드에서 GameScreen 대신 tick_logic에 전달되는 객체.
+
+    화면 전환, 레벨업 오버레이, 오디오처럼 메인 스레드에서 해야 하는 호출은 큐에 쌓고,
+    화면 전환/레벨업 요청 후에는 메인 스레드가 처리할 때까지 시뮬레이션을 멈춥니다.
+    """
+    def __init__(self, gs, sim):
+        self._gs = gs
+        self._sim = sim
+        self.audio = _DeferredCalls(gs.audio, sim.pending)
+
+    def __getattr__(self, name):
+        return getattr(self._gs, name)
+
+    def finish_game(self, success, reason):
+        self._defer(self._gs.finish_game, success, reason)
+
+    def trigger_level_up(self):
+        self._defer(self._gs.trigger_level_up)
+
+    def _defer(self, fn, *args):
+        self._sim.pending.append((fn, args))
+        self._sim.hold = True
+
+class SimulationThread(threading.Thread):
+    """GameScreen의 게임 로직을 고정 주기(SIM_RATE)로 실행하고 스냅샷을 이중 버퍼로 발행합니다.
+
+    틱을 처리하는 동안에는 lock을 잡고 있으므로, 메인 스레드는 입력 처리/요청 실행 시에만
+    같은 lock을 잡고 그리기는 lock 없이 최신 스냅샷으로 합니다 (blit은 GIL을 놓으므로 겹쳐 실행됨).
+    """
+    def __init__(self, gs, rate=SIM_RATE):
+        super().__init__(name="simulation", daemon=True)
+        self.gs = gs
+        self.step = 1.0 / rate
+        self.lock = threading.Lock()
+        self.pending = deque()   # 메인 스레드에서 실행할 (함수, 인자) 목록
+        self.hold = False        # 레벨업/종료 요청이 처리될 때까지 틱 중단
+        self.running = True
+        self.keys = None         # 메인 스레드가 매 프레임 기록하는 키 상태
+        self.ticks = 0
+        self.buffers = [None, None]
+        self.front = 0
+        self.context = SimContext(gs, self)
+        self.publish(RenderSnapshot.capture(gs.controller, gs.skills, True))
+
+    @property
+    def latest(self):
+        return self.buffers[self.front]
+
+    def publish(self, snap):
+        # 뒤쪽 버퍼에 기록한 뒤 인덱스만 바꿔서 그리는 쪽이 항상 완성된 스냅샷을 보게 함
+        back = 1 - self.front
+        self.buffers[back] = snap
+        self.front = back
+
+    def run(self):
+        next_t = time.perf_counter()
+        while self.running:
+            now = time.perf_counter()
+            if now < next_t:
+                time.sleep(next_t - now)
+                continue
+            # 0.25초 이상 밀리면 따라잡기를 포기하고 현재 시각부터 다시 계산
+            if now - next_t > 0.25: next_t = now
+            next_t += self.step
+            with self.lock:
+                if not self.running or self.hold or not self.gs.can_simulate(): continue
+                self.gs.step(self.step, self.context, self.keys)
+                self.ticks += 1
+                self.publish(RenderSnapshot.capture(self.gs.controller, self.gs.skills, True))
+
+    def drain(self):
+        """메인 스레드에서 호출: 쌓인 요청을 실행하고 시뮬레이션을 재개합니다 (lock을 잡은 상태에서)."""
+        while self.pending:
+            fn, args = self.pending.popleft()
+            fn(*args)
+        self.hold = False
+
+    def stop(self, join=False):
+        """종료 표시를 합니다. join은 lock을 잡지 않은 호출자만 사용 (진행 중인 틱이 끝날 때까지 대기).
+
+        화면 전환 중에는 lock을 잡은 상태에서 호출되므로 기본값은 join하지 않고 표시만 함.
+        """
+        self.running = False
+        if join and self.is_alive() and threading.current_thread() is not self: self.join()
@@ -1,6 +1,90 @@
+import os
+import copy
+import json
 import math
 import pygame
 import random
+from collections import namedtuple
+from config import MAX_SKILL_LEVEL, SKILL_STATS_FILE
+
+# =========================
+# 레벨별 스탯 테이블
+# =========================
+# 레벨 조건 분기는 모듈 로드 시 한 번만 계산해서 불변 레코드 튜플로 만들어 두고,
+# 스킬은 레벨이 바뀔 때 해당 레코드를 self.stats에 캐시합니다. (인덱스 0은 1레벨과 동일)
+ShotStats = namedtuple("ShotStats", "interval count damage")
+FireStats = namedtuple("FireStats", "interval count damage radius size")
+ShockStats = namedtuple("ShockStats", "interval count damage")
+ShieldStats = namedtuple("ShieldStats", "interval duration radius damage slow width color")
+
+def _shot_stats(lv):
+    interval = 1.0
+    if lv in (3, 4): interval *= 0.8   # 3~4단계: 20% 속도 강화
+    elif lv >= 5: interval = 0.15      # 5단계: 무한 연사 상태
+    count = 3 if lv >= 4 else 2 if lv >= 2 else 1
+    return ShotStats(interval, count, 10 + (5 if lv >= 5 else 0))
+
+def _fire_stats(lv):
+    radius = 60
+    if lv >= 2: radius *= 1.5  # 2단계: 범위 1.5배 확대
+    if lv >= 5: radius *= 1.3  # 5단계: 추가 확대
+    return FireStats(
+        5.0 * (0.7 if lv >= 5 else 1.0),     # 5단계: 발사 간격 30% 감소
+        2 if lv >= 3 else 1,                 # 3단계: 공격 횟수 증가
+        10 * (1.8 if lv >= 4 else 1.0),      # 4단계: 데미지 약 80% 상승
+        radius,
+        (60, 150) if lv >= 5 else (30, 80),  # 5단계: 투사체 대형화
+    )
+
+def _shock_stats(lv):
+    return ShockStats(
+        1.0 * (0.4 if lv >= 5 else 1.0),     # 5단계: 쿨타임 60% 감소
+        lv + 2 if lv >= 5 else lv,           # 레벨만큼 번개 줄기 (5단계 +2)
+        5 * (1.5 if lv >= 3 else 1.0),       # 3단계: 데미지 증가
+    )
+
+def _shield_stats(lv):
+    radius = 50
+    if lv >= 2: radius *= 1.3
+    if lv >= 5: radius *= 1.2
+    damage = 10
+    if lv >= 3: damage *= 1.5
+    if lv >= 5: damage *= 1.4
+    return ShieldStats(
+        10.0,
+        5.0 + (lv - 1) * 5.0,                # 기본 5초 + 레벨당 5초
+        radius,
+        damage,
+        0.7 if lv >= 4 else 1.0,             # 4단계: 범위 내 적 30% 감속
+        4 if lv >= 5 else 2,
+        (60, 100, 255, 90) if lv >= 4 else (100, 150, 255, 60),
+    )
+
+def _load_overrides(path):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"스킬 스탯 파일 로드 오류: {e}")
+        return {}
+
+def compile_stat_table(name, level_fn, overrides):
+    """레벨 0~MAX_SKILL_LEVEL의 스탯 레코드 튜플을 만들고, 데이터 파일 값을 덮어씁니다."""
+    table = []
+    for lv in range(MAX_SKILL_LEVEL + 1):
+        rec = level_fn(max(1, lv))
+        patch = overrides.get(name, {}).get(str(max(1, lv)), {})
+        if patch:
+            rec = rec._replace(**{k: tuple(v) if isinstance(v, list) else v for k, v in patch.items()})
+        table.append(rec)
+    return tuple(table)
+
+_OVERRIDES = _load_overrides(SKILL_STATS_FILE)
+SHOT_TABLE = compile_stat_table("BaseShotSkill", _shot_stats, _OVERRIDES)
+FIRE_TABLE = compile_stat_table("FireConeSkill", _fire_stats, _OVERRIDES)
+SHOCK_TABLE = compile_stat_table("ElectricShockSkill", _shock_stats, _OVERRIDES)
+SHIELD_TABLE = compile_stat_table("ShieldSkill", _shield_stats, _OVERRIDES)
 
 # =========================
 # Projectile 클래스
@@ -22,27 +106,47 @@ class Projectile:
         self.life -= dt
         self.rect.topleft = (self.pos.x, self.pos.y)
 
-    def draw(self, surf, cam):
-        screen_pos = (self.pos.x - cam.x, self.pos.y - cam.y)
-        alpha = int((self.life / self.max_life) * 255)
+    def snapshot(self):
+        """그리기용 사본 (위치/속도 벡터까지 복사)"""
+        v = copy.copy(self)
+        v.pos = pygame.Vector2(self.pos)
+        v.vel = pygame.Vector2(self.vel)
+        return v
+
+    def draw(self, surf, view, quality=None):
+        """view(RenderScaler)의 배율에 맞춰 위치와 크기를 변환해서 그립니다."""
+        screen_pos = view.point(self.pos.x, self.pos.y)
+        size = (view.length(self.size[0]), view.length(self.size[1]))
+        # 품질 단계에 따라 투명도 감소(fade)와 화염 회전을 생략
+        fade = quality is None or quality.fade
+        alpha = int((self.life / self.max_life) * 255) if fade else 255
         
-        if self.is_fire:
+        if self.is_fire and quality is not None and not quality.fire_rotate:
+            # 회전/반투명 없이 진행 방향과 무관한 직사각형으로 표시
+            w, h = size[1], size[0]
+            r = pygame.Rect(0, 0, w, h); r.center = screen_pos
+            pygame.draw.rect(surf, self.color, r)
+            pygame.draw.rect(surf, (255, 200, 50), r.inflate(-view.length(10), -view.length(4)))
+        elif self.is_fire:
             # [일직선 화염 기둥 시각화]
             # 진행 방향에 맞춰 직사각형을 회전시킵니다.
             angle = math.degrees(math.atan2(-self.vel.y, self.vel.x))
             
             # size[1]은 길이(일자로 쭉 뻗는 정도), size[0]은 폭(두께)입니다.
-            fire_surf = pygame.Surface((self.size[1], self.size[0]), pygame.SRCALPHA)
+            fire_surf = pygame.Surface((size[1], size[0]), pygame.SRCALPHA)
             
             # 화염 기둥 효과 (테두리는 붉은색, 안쪽은 밝은 주황색)
-            pygame.draw.rect(fire_surf, (*self.color, alpha), (0, 0, self.size[1], self.size[0]), border_radius=5)
-            pygame.draw.rect(fire_surf, (255, 200, 50, alpha), (5, 2, self.size[1]-10, self.size[0]-4), border_radius=3)
+            ix, iy = view.length(5), view.length(2)
+            pygame.draw.rect(fire_surf, (*self.color, alpha), (0, 0, size[1], size[0]), border_radius=view.length(5))
+            pygame.draw.rect(fire_surf, (255, 200, 50, alpha), (ix, iy, size[1]-ix*2, size[0]-iy*2), border_radius=view.length(3))
             
             rotated_fire = pygame.transform.rotate(fire_surf, angle)
             new_rect = rotated_fire.get_rect(center=(screen_pos[0], screen_pos[1]))
             surf.blit(rotated_fire, new_rect.topleft)
+        elif not fade:
+            surf.fill(self.color, (screen_pos, size))
         else:
-            s = pygame.Surface(self.size, pygame.SRCALPHA)
+            s = pygame.Surface(size, pygame.SRCALPHA)
             s.fill((*self.color, alpha))
             surf.blit(s, screen_pos)
 
@@ -50,15 +154,76 @@ class Projectile:
 # SkillBase (공통 부모 클래스)
 # =========================
 class SkillBase:
-    def __init__(self, name, interval, damage):
+    STATS = None  # 레벨별 스탯 테이블 (하위 클래스에서 지정)
+
+    def __init__(self, name, damage):
         self.name = name
-        self.level = 1
-        self.interval = interval
-        self.timer = 0.0
+        self.stats = None
+        self.scheduler = None
+        self._event = None        # 다음 쿨다운 만료 이벤트
+        self._phase_start = 0.0   # 현재 쿨다운(또는 지속) 구간이 시작된 시뮬레이션 시각
+        self.level = 1  # 발사 간격은 스탯 테이블(stats.interval)에서 읽음
         self.base_damage = damage
 
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, value):
+        # 레벨이 바뀔 때만 해당 레벨의 스탯 레코드를 캐시
+        old = getattr(self, "_level", 0)
+        self._level = value
+        if self.STATS:
+            self.stats = self.STATS[max(0, min(value, len(self.STATS) - 1))]
+        if self.scheduler is not None:
+            # 새로 해금된 스킬은 지금부터 쿨다운 시작, 기존 스킬은 바뀐 간격으로 만료 시각 재계산
+            if old <= 0 < value: self._phase_start = self.scheduler.now
+            self._reschedule()
+
+    def reset(self, level):
+        """새 판 시작 시 객체를 다시 만들지 않고 처음 상태로 되돌립니다 (이후 bind로 다시 등록)."""
+        # 남은 쿨다운 이벤트를 취소하고, 레벨 변경 시 이전 스케줄러에 재등록하지 않도록 먼저 분리
+        if self.scheduler is not None: self.scheduler.cancel(self._event)
+        self.scheduler = None
+        self._event = None
+        self._phase_start = 0.0
+        self.level = level
+
+    def bind(self, scheduler):
+        """쿨다운을 매 프레임 누적하는 대신 스케줄러 이벤트로 등록합니다."""
+        self.scheduler = scheduler
+        self._phase_start = scheduler.now
+        self._reschedule()
+
+    def cooldown(self):
+        """현재 구간의 길이 (기본: 발사 간격)."""
+        return self.stats.interval
+
+    def _reschedule(self):
+        self.scheduler.cancel(self._event)
+        self._event = None
+        if self.level <= 0 or not self.STATS: return
+        due = max(self.scheduler.now, self._phase_start + self.cooldown())
+        self._event = self.scheduler.schedule_at(due, self._on_event)
+
+    def _on_event(self, gs, controller):
+        self._event = None
+        self._phase_start = self.scheduler.now
+        self.on_cooldown(controller.player, controller.enemies, controller.skill_projectiles)
+        self._reschedule()
+
+    def on_cooldown(self, player, monsters, projectiles):
+        """쿨다운이 끝났을 때 실행할 동작 (하위 클래스에서 구현)."""
+        pass
+
+    def snapshot(self):
+        """그리기용 사본 (시뮬레이션 스레드 모드에서 스냅샷에 담김)"""
+        return copy.copy(self)
+
     def update(self, dt, player, monsters, projectiles):
-        self.timer += dt
+        """매 프레임 처리해야 하는 지속 효과 (쿨다운은 스케줄러가 처리)."""
+        pass
 
     def apply_upgrade(self):
         self.level += 1
@@ -67,30 +232,21 @@ class SkillBase:
 # 1. BaseShotSkill (마법 총 / 마우스 조준 방식)
 # =========================
 class BaseShotSkill(SkillBase):
+    STATS = SHOT_TABLE
+
     def __init__(self):
         # 1단계: 기본 발사 - 기본 데미지 10, 초기 발사 간격 1.0초
-        super().__init__("마법 총", 1.0, 10)
+        super().__init__("마법 총", 10)
 
-    def update(self, dt, player, monsters, projectiles):
-        super().update(dt, player, monsters, projectiles)
-        
-        # 레벨업에 따른 발사 속도(interval) 강화 반영
-        current_interval = self.interval
-        if self.level == 3:
-            current_interval *= 0.8  # 20% 속도 강화
-        elif self.level == 4:
-            current_interval *= 0.8  # 3단계 효과 유지
-        elif self.level >= 5:
-            current_interval = 0.15   # 5단계: 무한 연사 상태
-
-        if self.timer >= current_interval:
-            self.timer = 0
-            self.fire_to_mouse(player, projectiles)
+    def on_cooldown(self, player, monsters, projectiles):
+        # 레벨업에 따른 발사 속도(interval) 강화는 스탯 테이블에 반영되어 있음
+        self.fire_to_mouse(player, projectiles)
 
     def fire_to_mouse(self, player, projectiles):
         """[기능 추가] 마우스 커서 방향으로 조준하여 발사"""
-        # 1. 마우스 현재 위치 가져오기
-        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        # 1. 마우스 현재 위치 가져오기 (봇 시뮬레이션에서는 player.aim_pos 사용)
+        aim = getattr(player, 'aim_pos', None)
+        mouse_pos = pygame.Vector2(aim) if aim is not None else pygame.Vector2(pygame.mouse.get_pos())
         
         # 2. 플레이어의 화면상 위치 가져오기 (메인 엔진의 player.screen_pos 사용)
         # 만약 player 객체에 screen_pos가 없다면 SCREEN_W/2, SCREEN_H/2를 기본값으로 사용
@@ -102,14 +258,9 @@ class BaseShotSkill(SkillBase):
         if direction.length_squared() > 0:
             target_dir = direction.normalize()
             
-            # 레벨별 투사체 개수 설정
-            projectile_count = 1
-            if self.level >= 2: projectile_count = 2
-            if self.level >= 4: projectile_count = 3
-            
-            final_damage = self.base_damage
-            if self.level >= 5:
-                final_damage += 5
+            # 레벨별 투사체 개수 및 데미지
+            projectile_count = self.stats.count
+            final_damage = self.stats.damage
 
             # 4. 투사체 생성 및 발사
             for i in range(projectile_count):
@@ -127,46 +278,25 @@ class BaseShotSkill(SkillBase):
 # 2. FireConeSkill (로켓 방식 파이어볼)
 # =========================
 class FireConeSkill(SkillBase):
+    STATS = FIRE_TABLE
+
     def __init__(self):
         # 1단계: 기본 발사 - 무작위 적 타겟팅, 5초 주기, 데미지 10
-        super().__init__("파이어 볼", 5.0, 10)
+        super().__init__("파이어 볼", 10)
         self.explosion_radius = 60  # 초기 폭발 반지름
 
-    def update(self, dt, player, monsters, projectiles):
-        super().update(dt, player, monsters, projectiles)
-        
-        # 5단계: 연사력 강화 (발사 간격 30% 감소)
-        current_interval = self.interval
-        if self.level >= 5:
-            current_interval *= 0.7
-
-        if self.timer >= current_interval:
-            self.timer = 0
-            self.fire_rocket(player, monsters, projectiles)
+    def on_cooldown(self, player, monsters, projectiles):
+        # 5단계 연사력 강화는 스탯 테이블에 반영되어 있음
+        self.fire_rocket(player, monsters, projectiles)
 
     def fire_rocket(self, player, monsters, projectiles):
         """1. 타겟팅 로직: 무작위 조준 및 발사"""
-        # 3단계: 공격 횟수 증가 (기본 1발, 3단계부터 2발)
-        target_count = 1
-        if self.level >= 3:
-            target_count = 2
-
-        # 4단계: 데미지 강화 (약 80% 상승)
-        final_damage = self.base_damage
-        if self.level >= 4:
-            final_damage *= 1.8
-
-        # 2단계 & 5단계: 폭발 범위 및 크기 설정
-        current_radius = self.explosion_radius
-        if self.level >= 2:
-            current_radius *= 1.5  # 2단계: 범위 1.5배 확대
-        if self.level >= 5:
-            current_radius *= 1.3  # 5단계: 추가 확대
-
-        # 투사체 크기 (5단계에서 대형화)
-        proj_size = (30, 80)
-        if self.level >= 5:
-            proj_size = (60, 150)
+        # 공격 횟수 / 데미지 / 폭발 범위 / 투사체 크기 (레벨별 스탯 레코드)
+        st = self.stats
+        target_count = st.count
+        final_damage = st.damage
+        current_radius = st.radius
+        proj_size = st.size
 
         for _ in range(target_count):
             target_pos = None
@@ -203,43 +333,100 @@ class FireConeSkill(SkillBase):
             if (m.pos - explosion_pos).length_squared() <= radius_sq:
                 m.hp -= projectile.damage
 
+# =========================
+# 번개 모양 뱅크 (미리 그려 둔 번개 스프라이트)
+# =========================
+BOLT_STEPS = 5       # 지그재그 꺾임 횟수
+BOLT_VARIANTS = 16   # 미리 만들어 둘 번개 모양 수
+BOLT_RING = 32       # 동시에 표시할 수 있는 번개 수 (넘치면 가장 오래된 것을 덮어씀)
+BOLT_LIFE = 0.1      # 번개가 화면에 남아 있는 시간(초)
+_bolt_bank = None
+# 번개 모양 생성/선택 전용 난수 생성기: 시각 효과가 게임 로직의 random 흐름을 소비하지 않도록 분리
+_bolt_rng = random.Random()
+
+def _bolt_template(rng):
+    """목표 지점 기준 지그재그 꺾임점 상대 좌표 (적의 머리 위 400px 하늘에서 떨어지는 모양)"""
+    sx, sy = rng.randint(-20, 20), -400
+    points = []
+    for i in range(BOLT_STEPS + 1):
+        t = i / BOLT_STEPS
+        x, y = sx * (1 - t), sy * (1 - t)
+        if 0 < i < BOLT_STEPS:
+            # 무작위 오프셋(Offset) 추가
+            x += rng.randint(-15, 15); y += rng.randint(-10, 10)
+        points.append((x, y))
+    return points
+
+def _render_bolt(points, detail):
+    """꺾임점을 콜러키 스프라이트로 그리고, 목표 지점 기준 좌상단 오프셋과 함께 반환합니다."""
+    pad = 3
+    ox, oy = int(min(x for x, _ in points)) - pad, int(min(y for _, y in points)) - pad
+    w = int(max(x for x, _ in points)) - ox + pad + 1
+    h = int(max(y for _, y in points)) - oy + pad + 1
+    local = [(x - ox, y - oy) for x, y in points]
+
+    s = pygame.Surface((w, h))
+    if pygame.display.get_surface(): s = s.convert()
+    s.fill((0, 0, 0))
+    if detail:
+        # 번개 외곽선 (하늘색/흰색) + 중심선 (흰색)
+        pygame.draw.lines(s, (200, 255, 255), False, local, 3)
+        pygame.draw.lines(s, (255, 255, 255), False, local, 1)
+    else:
+        # 간소화: 꺾임 점을 절반으로 줄인 단일 선
+        pygame.draw.lines(s, (220, 255, 255), False, local[::2] + local[-1:], 2)
+    # 검은 배경은 투명 처리, RLE로 빈 영역을 건너뛰며 빠르게 블릿
+    s.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    return s, (ox, oy)
+
+def get_bolt_bank():
+    """(상세 스프라이트 목록, 간소화 스프라이트 목록)을 처음 그릴 때 한 번만 생성합니다."""
+    global _bolt_bank
+    if _bolt_bank is None:
+        templates = [_bolt_template(_bolt_rng) for _ in range(BOLT_VARIANTS)]
+        _bolt_bank = ([_render_bolt(t, True) for t in templates],
+                      [_render_bolt(t, False) for t in templates])
+    return _bolt_bank
+
 # =========================
 # ElectricShockSkill (일렉트릭 쇼크 - 즉시 타격형)
 # =========================
 class ElectricShockSkill(SkillBase):
+    STATS = SHOCK_TABLE
+
     def __init__(self):
         # 기본 쿨타임 1.0초 (5단계에서 감소됨), 데미지 5
-        super().__init__("일렉트릭 쇼크", 1.0, 5)
-        self.strike_visuals = []  # 현재 화면에 그려질 번개 시각 효과 리스트
+        super().__init__("일렉트릭 쇼크", 5)
+        # 현재 화면에 그려질 번개: 고정 크기 링 (모양 번호, 목표 좌표, 생성 시각)
+        self.now = 0.0
+        self.bolt_head = 0
+        self.bolt_variant = [0] * BOLT_RING
+        self.bolt_x = [0.0] * BOLT_RING
+        self.bolt_y = [0.0] * BOLT_RING
+        self.bolt_born = [-math.inf] * BOLT_RING
+
+    def reset(self, level):
+        super().reset(level)
+        self.now = 0.0
+        self.bolt_head = 0
+        for i in range(BOLT_RING): self.bolt_born[i] = -math.inf
 
     def update(self, dt, player, monsters, projectiles):
-        # 1. 공격 주기 및 상태 관리 (Update Logic)
-        self.timer += dt
-        
-        # [조건 반영] 5단계: 발사 간격(쿨타임) 대폭 감소
-        current_cooldown = self.interval
-        if self.level >= 5:
-            current_cooldown *= 0.4  # 60% 감소 (에너지 큐브 효과 모사)
-
-        if self.timer >= current_cooldown:
-            self.timer = 0
-            self.strike_lightning(player, monsters)
+        # 번개 표시 시간 계산용 시계 (일시정지/레벨업 선택 중에는 멈춤)
+        self.now += dt
 
-        # 시각 효과 타이머 업데이트 (0.1초 동안만 유지)
-        for visual in self.strike_visuals[:]:
-            visual['life'] -= dt
-            if visual['life'] <= 0:
-                self.strike_visuals.remove(visual)
+    def on_cooldown(self, player, monsters, projectiles):
+        # 5단계 쿨타임 감소는 스탯 테이블에 반영되어 있음
+        self.strike_lightning(player, monsters)
 
     def strike_lightning(self, player, monsters):
         """즉시 판정 및 다중 타격 로직"""
         if not monsters:
             return
 
-        # [타겟팅 로직] 1~4단계: 레벨에 따라 번개 줄기 수 결정 (최대 4줄기 + 5단계 보너스)
-        strike_count = self.level
-        if self.level >= 5:
-            strike_count += 2  # 5단계 추가 공격 횟수
+        # [타겟팅 로직] 레벨에 따라 번개 줄기 수 결정 (최대 4줄기 + 5단계 보너스)
+        strike_count = self.stats.count
+        damage = self.stats.damage
 
         # [보스 우선순위] 보스가 있다면 리스트의 맨 앞으로 가져와 우선 타격 대상에 포함
         sorted_monsters = sorted(monsters, key=lambda m: getattr(m, 'kind', '') == 'finalboss', reverse=True)
@@ -250,137 +437,123 @@ class ElectricShockSkill(SkillBase):
         for target in targets:
             # 1. 즉시 판정 (Hitbox Logic)
             # 타겟팅되는 순간 즉시 HP 감소
-            damage = self.base_damage
-            if self.level >= 3: # 3단계: 데미지 증가
-                damage *= 1.5
             target.hp -= damage
 
-            # 2. 시각 효과 생성 (지그재그 좌표 생성)
+            # 2. 시각 효과 생성 (미리 만든 번개 모양 중 하나를 목표 위치에 배치)
             self.create_zigzag_effect(player.pos, target.pos)
 
-    def create_zigzag_effect(self, start_pos, end_pos):
-        """시작점과 끝점 사이에 무작위 오프셋을 가진 지그재그 좌표 생성"""
-        points = []
-        steps = 5 # 지그재그 꺾임 횟수
-        
-        # 하늘에서 떨어지는 느낌을 위해 시작점을 적의 머리 위로 설정
-        sky_start = pygame.Vector2(end_pos.x + random.randint(-20, 20), end_pos.y - 400)
-        
-        for i in range(steps + 1):
-            t = i / steps
-            # 선형 보간 점
-            base_pos = sky_start.lerp(end_pos, t)
-            if 0 < i < steps:
-                # 무작위 오프셋(Offset) 추가
-                offset = pygame.Vector2(random.randint(-15, 15), random.randint(-10, 10))
-                base_pos += offset
-            points.append(base_pos)
-        
-        self.strike_visuals.append({'points': points, 'life': 0.1})
+    def snapshot(self):
+        v = copy.copy(self)
+        v.bolt_variant, v.bolt_x, v.bolt_y, v.bolt_born = (list(self.bolt_variant), list(self.bolt_x),
+                                                          list(self.bolt_y), list(self.bolt_born))
+        return v
 
-    def draw(self, surf, cam):
-        """지그재그 번개 렌더링"""
-        for visual in self.strike_visuals:
-            if len(visual['points']) < 2:
-                continue
-            
-            # 카메라 좌표로 변환된 점들 생성
-            screen_points = [(p.x - cam.x, p.y - cam.y) for p in visual['points']]
-            
-            # 번개 외곽선 (하늘색/흰색)
-            pygame.draw.lines(surf, (200, 255, 255), False, screen_points, 3)
-            # 번개 중심선 (흰색)
-            pygame.draw.lines(surf, (255, 255, 255), False, screen_points, 1)
+    def create_zigzag_effect(self, start_pos, end_pos):
+        """번개 모양 번호와 목표 지점을 링에 기록 (가장 오래된 칸을 덮어씀)"""
+        i = self.bolt_head
+        self.bolt_variant[i] = _bolt_rng.randrange(BOLT_VARIANTS)
+        self.bolt_x[i] = end_pos.x
+        self.bolt_y[i] = end_pos.y
+        self.bolt_born[i] = self.now
+        self.bolt_head = (i + 1) % BOLT_RING
+
+    def draw(self, surf, view, quality=None):
+        """지그재그 번개 렌더링 (최근 것부터 만료된 번개를 만날 때까지)"""
+        detail, simple = get_bolt_bank()
+        bank = detail if quality is None or quality.lightning_detail else simple
+        limit = quality.max_effects if quality is not None and quality.max_effects else BOLT_RING
+        for k in range(min(limit, BOLT_RING)):
+            i = (self.bolt_head - 1 - k) % BOLT_RING
+            if self.now - self.bolt_born[i] >= BOLT_LIFE: break  # 이보다 오래된 칸은 모두 만료
+            sprite, (ox, oy) = bank[self.bolt_variant[i]]
+            surf.blit(view.sprite(sprite), view.point(self.bolt_x[i] + ox, self.bolt_y[i] + oy))
 
 # =========================
 # 4. ShieldSkill (프로텍트 쉴드 - 지속 범위 및 감속)
 # =========================
 class ShieldSkill(SkillBase):
+    STATS = SHIELD_TABLE
+
     def __init__(self):
         # 1단계: 기본 활성화 - 반지름 50px, 기본 데미지 10, 10초 주기 발동
-        super().__init__("프로텍트 쉴드", 10.0, 10)
+        super().__init__("프로텍트 쉴드", 10)
         self.base_duration = 5.0
         self.radius = 50
         self.is_active = False
         self.active_timer = 0.0
 
+    def reset(self, level):
+        super().reset(level)
+        self.is_active = False
+        self.active_timer = 0.0
+
+    def cooldown(self):
+        # 비활성 상태에서는 재발동 대기 시간, 활성 상태에서는 유지 시간
+        return self.stats.duration if self.is_active else self.stats.interval
+
+    def on_cooldown(self, player, monsters, projectiles):
+        # 1. 상태 전환 (대기 -> 활성화 -> 해제)
+        # 보호막 해제 시 몬스터 속도 원복을 위해 추가 처리 필요 (update 판정 로직 참고)
+        self.is_active = not self.is_active
+
     def update(self, dt, player, monsters, projectiles):
-        # 1. 상태 관리 (활성화/비활성화 타이머)
-        if not self.is_active:
-            self.timer += dt
-            if self.timer >= self.interval:
-                self.is_active = True
-                self.active_timer = 0
-                self.timer = 0
-        else:
-            self.active_timer += dt
-            # 레벨업에 따른 유지 기간 증가 (기본 5초 + 레벨당 5초)
-            current_duration = self.base_duration + (self.level - 1) * 5.0
-            
-            # 2 & 5단계: 범위(반지름) 확대 로직
-            # 1단계(50) -> 2단계(x1.3) -> 5단계(x1.2 추가)
-            calc_radius = self.radius
-            if self.level >= 2: calc_radius *= 1.3
-            if self.level >= 5: calc_radius *= 1.2
-            
-            # 3 & 5단계: 데미지 강화 로직
-            final_damage = self.base_damage
-            if self.level >= 3: final_damage *= 1.5
-            if self.level >= 5: final_damage *= 1.4
-
-            if self.active_timer >= current_duration:
-                # 보호막 해제 시 몬스터 속도 원복을 위해 추가 처리 필요 (아래 판정 로직 참고)
-                self.is_active = False
+        if not self.is_active: return
+        # 유지 기간 / 반지름 / 데미지 / 감속은 레벨별 스탯 레코드에서 읽음
+        st = self.stats
+
+        # 2. 판정 로직: 범위 내 적에게 틱 데미지 및 감속(Slow) 적용
+        radius_sq = st.radius ** 2
+        for m in monsters:
+            dist_sq = (m.pos - player.pos).length_squared()
+            if dist_sq <= radius_sq:
+                # [틱 데미지] dt에 비례하여 지속적으로 HP 차감
+                m.hp -= st.damage * dt
+                
+                # [4단계: 감속 장치] 범위 내 적 이동 속도 30% 감소 (0.7배)
+                if st.slow < 1.0:
+                    # 몬스터의 원본 속도를 보존하면서 감속 적용
+                    if not hasattr(m, 'original_speed'):
+                        m.original_speed = m.speed
+                    m.speed = m.original_speed * st.slow
             else:
-                # 2. 판정 로직: 범위 내 적에게 틱 데미지 및 감속(Slow) 적용
-                for m in monsters:
-                    dist_sq = (m.pos - player.pos).length_squared()
-                    if dist_sq <= calc_radius ** 2:
-                        # [틱 데미지] dt에 비례하여 지속적으로 HP 차감
-                        m.hp -= final_damage * dt
-                        
-                        # [4단계: 감속 장치] 범위 내 적 이동 속도 30% 감소 (0.7배)
-                        if self.level >= 4:
-                            # 몬스터의 원본 속도를 보존하면서 감속 적용
-                            if not hasattr(m, 'original_speed'):
-                                m.original_speed = m.speed
-                            m.speed = m.original_speed * 0.7
-                    else:
-                        # 범위를 벗어난 적은 속도 원상복구
-                        if hasattr(m, 'original_speed'):
-                            m.speed = m.original_speed
-
-    def draw(self, surf, player, cam):
+                # 범위를 벗어난 적은 속도 원상복구
+                if hasattr(m, 'original_speed'):
+                    m.speed = m.original_speed
+
+    def draw(self, surf, player, view, quality=None):
         if self.is_active:
-            # 현재 레벨에 따른 실시간 반지름 계산 (update 로직과 동일)
-            draw_radius = self.radius
-            if self.level >= 2: draw_radius *= 1.3
-            if self.level >= 5: draw_radius *= 1.2
-            
-            screen_pos = (int(player.pos.x - cam.x), int(player.pos.y - cam.y))
+            # update와 같은 스탯 레코드의 반지름 사용 (내부 해상도 배율 적용)
+            st = self.stats
+            draw_radius = view.length(st.radius)
             
-            # 시각 효과: 반투명 원형 보호막
-            shield_surf = pygame.Surface((draw_radius * 2, draw_radius * 2), pygame.SRCALPHA)
-            # 4단계 이상이면 감속 역장을 표현하기 위해 색상을 진하게 변경
-            shield_color = (100, 150, 255, 60) if self.level < 4 else (60, 100, 255, 90)
+            x, y = view.point(player.pos.x, player.pos.y)
+            screen_pos = (int(x), int(y))
             
-            pygame.draw.circle(shield_surf, shield_color, (int(draw_radius), int(draw_radius)), int(draw_radius))
-            surf.blit(shield_surf, (screen_pos[0] - draw_radius, screen_pos[1] - draw_radius))
+            # 시각 효과: 반투명 원형 보호막 (저품질 단계에서는 테두리만)
+            if quality is None or quality.shield_aura:
+                shield_surf = pygame.Surface((draw_radius * 2, draw_radius * 2), pygame.SRCALPHA)
+                # 4단계 이상이면 감속 역장을 표현하기 위해 색상을 진하게 변경 (스탯 테이블)
+                pygame.draw.circle(shield_surf, st.color, (int(draw_radius), int(draw_radius)), int(draw_radius))
+                surf.blit(shield_surf, (screen_pos[0] - draw_radius, screen_pos[1] - draw_radius))
             
             # 테두리 선
-            pygame.draw.circle(surf, (150, 200, 255), screen_pos, int(draw_radius), 2 if self.level < 5 else 4)
+            pygame.draw.circle(surf, (150, 200, 255), screen_pos, int(draw_radius), view.length(st.width))
 
 # =========================
 # HealPotionSkill (회복 물약 - HP 회복형(3회 한정))
 # =========================
 class HealPotionSkill(SkillBase):
     def __init__(self):
-        # interval, damage는 의미 없지만 SkillBase 구조 유지용
-        super().__init__("회복 물약", interval=0, damage=0)
+        # damage는 의미 없지만 SkillBase 구조 유지용
+        super().__init__("회복 물약", damage=0)
         self.max_uses = 3          # 최대 3회
         self.heal_amount = 50     # 회복량
         self.pending_heal = False
 
+    def reset(self, level):
+        super().reset(level)
+        self.pending_heal = False
+
     def apply_upgrade(self):
         """
         레벨업 = 물약 선택
@@ -0,0 +1,88 @@
+import os
+import json
+import bisect
+from collections import namedtuple
+from config import WAVES_FILE, BGM_FINAL_BOSS, BGM_PREPARE_LEAD
+
+# 데이터 파일이 없을 때 사용하는 기본 타임라인 (data/waves.json과 동일)
+DEFAULT_WAVES = {
+    "total_time": 300,
+    "spawn_curve": {"interp": "step", "points": [[0, 0.0], [60, 0.25], [120, 0.5], [180, 0.75], [240, 1.0]]},
+    "mob_cycle": ["skull", "spider"],
+    "events": [{"at": 120, "boss": "midboss"}, {"at": 240, "boss": "finalboss"}],
+}
+BOSS_KINDS = ("midboss", "finalboss")
+
+# time: 발생 시각(초), action: WaveManager 처리 함수 이름, arg: 인자
+WaveEvent = namedtuple("WaveEvent", "time action arg")
+
+# total_time: 제한 시간, events: 시각순 이벤트 튜플, event_times: 이벤트 시각 (커서 재배치용)
+# spawn_ratio: 초 단위 스폰 비율 (0=spawn_prob_start, 1=spawn_prob_end), mob_cycle: 초마다 돌아가는 일반 몹 종류
+WaveTimeline = namedtuple("WaveTimeline", "total_time events event_times spawn_ratio mob_cycle")
+
+def _curve_value(points, t, interp):
+    """시간순 [시각, 값] 목록에서 t 시점의 값 (step: 직전 값 유지, linear: 선형 보간)."""
+    i = bisect.bisect_right([p[0] for p in points], t) - 1
+    if i < 0: return points[0][1]
+    if interp == "linear" and i + 1 < len(points):
+        (t0, v0), (t1, v1) = points[i], points[i + 1]
+        return v0 + (v1 - v0) * (t - t0) / (t1 - t0)
+    return points[i][1]
+
+def compile_timeline(data):
+    """웨이브 데이터(dict)를 시각순 이벤트 목록과 초 단위 스폰 비율 표로 컴파일합니다."""
+    total = int(data["total_time"])
+    curve = data["spawn_curve"]
+    points = sorted((float(t), float(v)) for t, v in curve["points"])
+    interp = curve.get("interp", "step")
+    if interp not in ("step", "linear"): raise ValueError(f"알 수 없는 보간 방식: {interp}")
+    ratio = tuple(_curve_value(points, sec, interp) for sec in range(total + 1))
+
+    events = []
+    for ev in data.get("events", []):
+        at, kind = float(ev["at"]), ev["boss"]
+        if kind not in BOSS_KINDS: raise ValueError(f"알 수 없는 보스 종류: {kind}")
+        events.append(WaveEvent(at, "boss", kind))
+        # 최종 보스 BGM은 등장 전에 미리 읽어 두어 전환 시 디스크 I/O로 프레임이 멈추지 않도록 함
+        if kind == "finalboss":
+            events.append(WaveEvent(max(0.0, at - BGM_PREPARE_LEAD), "prepare_bgm", BGM_FINAL_BOSS))
+    events.sort(key=lambda e: e.time)
+
+    mob_cycle = tuple(data.get("mob_cycle", ("skull", "spider")))
+    return WaveTimeline(float(total), tuple(events), [e.time for e in events], ratio, mob_cycle)
+
+def load_timeline(path=WAVES_FILE):
+    """waves.json을 읽어 컴파일합니다. 파일이 없거나 잘못되면 기본 타임라인을 사용합니다."""
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return compile_timeline(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"웨이브 파일 로드 오류 (기본값 사용): {e}")
+    return compile_timeline(DEFAULT_WAVES)
+
+class TimelineWatcher:
+    """개발 모드에서 waves.json 수정 시각을 확인해 바뀌었을 때만 다시 컴파일합니다."""
+    def __init__(self, path=WAVES_FILE):
+        self.path = path
+        self.mtime = self._stat()
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """변경되었으면 새 타임라인, 아니면 None (잘못된 파일은 무시하고 기존 타임라인 유지)."""
+        mtime = self._stat()
+        if mtime is None or mtime == self.mtime: return None
+        self.mtime = mtime
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                timeline = compile_timeline(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"웨이브 파일 다시 불러오기 실패 (기존 유지): {e}")
+            return None
+        print("웨이브 타임라인을 다시 불러왔습니다.")
+        return timeline
@@ -3,6 +3,7 @@ import random
 import math
 import os
 import json
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 
 # =========================
@@ -10,6 +11,7 @@ from abc import ABC, abstractmethod
 # =========================
 WIDTH, HEIGHT = 1100, 650
 FPS = 60
+CULL_MARGIN = 96 # 화면 밖 여유 거리 (최종 보스 120px 스프라이트의 절반 + 체력바)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 ASSET_DIR = os.path.join(BASE_DIR, "assets/")
@@ -86,20 +88,59 @@ class ResourceManager:
 # =========================
 # 3. World & Camera
 # =========================
+class TileChunkCache:
+    """타일 레이어를 chunk_size 단위 서피스로 한 번만 그려 두고 LRU 방식으로 재사용합니다."""
+    def __init__(self, tile_size, chunk_size=512, max_chunks=24):
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict() # (chunk_x, chunk_y) -> Surface
+
+    def _render_chunk(self, cx, cy):
+        size = self.chunk_size
+        surf = pygame.Surface((size, size))
+        if pygame.display.get_surface(): surf = surf.convert()
+        surf.fill(COLORS["BG"])
+
+        # 청크 영역에 걸치는 타일만 청크 기준 좌표로 그립니다 (경계 밖은 자동으로 잘림)
+        origin_x, origin_y = cx * size, cy * size
+        ts = self.tile_size
+        for x in range((origin_x // ts) * ts, origin_x + size, ts):
+            for y in range((origin_y // ts) * ts, origin_y + size, ts):
+                pygame.draw.rect(surf, COLORS["TILE"], (x - origin_x, y - origin_y, ts, ts), 1)
+        return surf
+
+    def get_chunk(self, cx, cy):
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        chunk = self._render_chunk(cx, cy)
+        self.chunks[key] = chunk
+        # 카메라에서 가장 오래 안 쓰인 청크부터 제거
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def draw(self, surface, camera_offset):
+        size = self.chunk_size
+        ox, oy = int(camera_offset.x), int(camera_offset.y)
+        sw, sh = surface.get_size()
+        for cx in range(ox // size, (ox + sw) // size + 1):
+            for cy in range(oy // size, (oy + sh) // size + 1):
+                surface.blit(self.get_chunk(cx, cy), (cx * size - ox, cy * size - oy))
+
 class World:
     def __init__(self, width, height):
         self.width = width
         self.height = height
         self.tile_size = 100
+        # 매 프레임 타일마다 draw.rect를 호출하는 대신 미리 그린 청크만 blit
+        self.chunk_cache = TileChunkCache(self.tile_size)
 
     def draw_background(self, surface, camera_offset):
-        start_x = int(camera_offset.x // self.tile_size) * self.tile_size
-        start_y = int(camera_offset.y // self.tile_size) * self.tile_size
-        
-        for x in range(start_x - self.tile_size, start_x + WIDTH + self.tile_size, self.tile_size):
-            for y in range(start_y - self.tile_size, start_y + HEIGHT + self.tile_size, self.tile_size):
-                rect = pygame.Rect(x - camera_offset.x, y - camera_offset.y, self.tile_size, self.tile_size)
-                pygame.draw.rect(surface, COLORS["TILE"], rect, 1)
+        self.chunk_cache.draw(surface, camera_offset)
 
 class Camera:
     def __init__(self):
@@ -212,6 +253,69 @@ class WaveManager:
             return True
         return False
 
+class SimulationLOD:
+    """플레이어와의 거리에 따라 적 시뮬레이션 주기를 나누는 LOD 스케줄러.
+
+    가까운 적은 매 프레임 갱신하고, 먼 적은 stride 프레임마다 누적된 dt로 한 번에
+    진행시킵니다. 적은 tier별 버킷에 나뉘어 있어 프레임당 비용은
+    (근거리 적 수 + 원거리 적 수 / stride)에 비례합니다.
+    """
+    # (최대 거리, 갱신 간격 프레임) - 화면 대각선 절반(약 640px) 바깥부터 감속
+    TIERS = ((900, 1), (1600, 4), (float("inf"), 16))
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.frame = 0
+        self.time = 0.0
+        self.buckets = [[[] for _ in range(stride)] for _, stride in self.TIERS]
+        self.active = []        # 이번 프레임에 정밀 갱신된 근거리 적 (충돌 판정 대상)
+        self.updated_count = 0  # 이번 프레임에 실제로 이동 처리한 적 수
+        self._next_slot = 0
+
+    def _tier_of(self, enemy, target_pos):
+        dist_sq = (enemy.world_pos - target_pos).length_squared()
+        for tier, (max_dist, _) in enumerate(self.TIERS):
+            if dist_sq <= max_dist * max_dist:
+                return tier
+        return len(self.TIERS) - 1
+
+    def add(self, enemy, target_pos):
+        enemy.lod_time = self.time
+        tier = self._tier_of(enemy, target_pos)
+        stride = self.TIERS[tier][1]
+        # 같은 프레임에 스폰된 적이 한 버킷에 몰리지 않도록 순환 배치
+        self._next_slot += 1
+        self.buckets[tier][self._next_slot % stride].append(enemy)
+
+    def update(self, dt, target_pos):
+        self.frame += 1
+        self.time += dt
+        self.active = []
+        self.updated_count = 0
+        moved = []  # (적, 새 tier): 아직 처리하지 않은 tier 버킷에 넣으면 같은 프레임에 두 번 갱신되므로 루프 후 배치
+
+        for tier, (_, stride) in enumerate(self.TIERS):
+            slot = self.frame % stride
+            bucket = self.buckets[tier][slot]
+            self.buckets[tier][slot] = []
+            for enemy in bucket:
+                if not enemy.alive(): continue
+                # 마지막 갱신 이후 누적된 시간만큼 진행 방향으로 한 번에 이동
+                step = self.time - enemy.lod_time
+                enemy.lod_time = self.time
+                enemy.follow(target_pos, step)
+                self.updated_count += 1
+
+                moved.append((enemy, self._tier_of(enemy, target_pos)))
+                if tier == 0:
+                    self.active.append(enemy)
+
+        # 다음 갱신은 새 tier의 stride 프레임 뒤
+        for enemy, new_tier in moved:
+            self.buckets[new_tier][self.frame % self.TIERS[new_tier][1]].append(enemy)
+
 # =========================
 # 6. Game Controller
 # =========================
@@ -236,16 +340,19 @@ class GameController:
         self.wave_mgr = WaveManager(self.rm.game_data["waves"])
         
         self.enemies = pygame.sprite.Group()
+        self.lod = SimulationLOD()
         self.all_sprites = pygame.sprite.Group()
         
         self.state = "START" # START, PLAYING, GAMEOVER, CLEAR
         self.kill_count = 0
         self.survive_time_str = "00:00"
+        self.cull_stats = {"drawn": 0, "culled": 0}
 
     def reset_game(self):
         self.player.reset()
         self.wave_mgr.reset()
         self.enemies.empty()
+        self.lod.reset()
         self.all_sprites.empty()
         self.all_sprites.add(self.player)
         self.kill_count = 0
@@ -281,10 +388,20 @@ class GameController:
         enemy = MonsterBase(spawn_pos.x, spawn_pos.y, m_data, self.rm)
         self.enemies.add(enemy)
         self.all_sprites.add(enemy)
+        self.lod.add(enemy, self.player.world_pos)
+
+    def query_visible(self, margin=CULL_MARGIN):
+        """카메라 영역(+마진)과 겹치는 스프라이트만 반환하고 컬링 카운터를 갱신합니다."""
+        view = pygame.Rect(int(self.camera.offset.x) - margin, int(self.camera.offset.y) - margin,
+                           WIDTH + margin * 2, HEIGHT + margin * 2)
+        visible = [s for s in self.all_sprites if view.collidepoint(s.world_pos)]
+        self.cull_stats["drawn"] = len(visible)
+        self.cull_stats["culled"] = len(self.all_sprites) - len(visible)
+        return visible
 
     def handle_collisions(self):
-        # 플레이어 피격
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
+        # 플레이어 피격 (근거리 LOD tier의 적만 판정)
+        hits = pygame.sprite.spritecollide(self.player, self.lod.active, False)
         for enemy in hits:
             if self.player.world_pos.distance_to(enemy.world_pos) < enemy.size * 0.7:
                 self.player.hp -= 0.5
@@ -364,7 +481,7 @@ class GameController:
             if self.state == "PLAYING":
                 self.player.move(dt, (self.world.width, self.world.height))
                 if self.wave_mgr.update(dt): self.spawn_enemy()
-                for enemy in self.enemies: enemy.follow(self.player.world_pos, dt)
+                self.lod.update(dt, self.player.world_pos)
                 self.handle_collisions()
                 self.camera.update(self.player.world_pos)
                 
@@ -377,7 +494,7 @@ class GameController:
             
             if self.state != "START":
                 # 보스 체력 바 표시 로직 추가 (필요 시)
-                for sprite in self.all_sprites:
+                for sprite in self.query_visible():
                     sprite.update_rect(self.camera.offset)
                     self.screen.blit(sprite.image, sprite.rect)
                     # 보스 전용 체력바 (간단히 표현)
@@ -10,6 +10,7 @@ class Config:
     WIDTH, HEIGHT = 800, 600
     FPS = 60
     TILE_SIZE = 64
+    CULL_MARGIN = 64 # 화면 밖 여유 거리 (가장 큰 엔티티 30px + 여유)
     COLORS = {
         "BG": (15, 15, 25),      # 어두운 밤
         "TILE": (25, 25, 40),    # 마법 학교 바닥
@@ -172,6 +173,7 @@ class GameController:
         self.projectiles = pygame.sprite.Group()
         self.is_paused = False
         self.font = pygame.font.SysFont("malgungothic", 22, bold=True)
+        self.cull_stats = {"drawn": 0, "culled": 0}
 
     def spawn(self):
         if len(self.enemies) < 25:
@@ -179,6 +181,17 @@ class GameController:
             pos = self.player.world_pos + pygame.Vector2(math.cos(angle), math.sin(angle)) * 550
             self.enemies.add(Enemy(pos.x, pos.y, random.choice(["dementor", "death_eater"])))
 
+    def query_visible(self, margin=Config.CULL_MARGIN):
+        """카메라 영역(+마진)과 겹치는 적/투사체만 반환하고 컬링 카운터를 갱신합니다."""
+        view = pygame.Rect(int(self.camera.offset.x) - margin, int(self.camera.offset.y) - margin,
+                           Config.WIDTH + margin * 2, Config.HEIGHT + margin * 2)
+        total = len(self.enemies) + len(self.projectiles)
+        visible = [s for s in self.enemies if view.collidepoint(s.world_pos)]
+        visible += [s for s in self.projectiles if view.collidepoint(s.world_pos)]
+        self.cull_stats["drawn"] = len(visible)
+        self.cull_stats["culled"] = total - len(visible)
+        return visible
+
     def collisions(self):
         # 마법 투사체 충돌
         for p in self.projectiles:
@@ -266,7 +279,7 @@ class GameController:
                 pygame.draw.circle(s_surface, (200, 230, 255, 60), (s_radius, s_radius), s_radius)
                 self.screen.blit(s_surface, (s_pos.x - s_radius, s_pos.y - s_radius))
 
-            for s in list(self.enemies) + list(self.projectiles) + [self.player]:
+            for s in self.query_visible() + [self.player]:
                 s.draw(self.screen, self.camera)
             
             self.draw_ui()